@@ -0,0 +1,70 @@
+"""
+_cache.py — small on-disk cache for LLM responses.
+
+SQLite keyed by SHA-256 digest with TTL expiry. Failures are swallowed:
+a broken cache file must never take the LLM path down, it just means
+every call is a miss.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_DB_PATH = os.environ.get(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".llm_cache.sqlite3"),
+)
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+
+
+def _db() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " response TEXT,"
+            " created_at INT,"
+            " expires_at INT)"
+        )
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached response for key, or None on miss/expiry/error."""
+    try:
+        with _lock:
+            row = _db().execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, expires_at = row
+            if expires_at < time.time():
+                _db().execute("DELETE FROM responses WHERE key = ?", (key,))
+                _db().commit()
+                return None
+            return response
+    except sqlite3.Error:
+        return None
+
+
+def put(key: str, response: str, ttl: int = 604800) -> None:
+    """Store a response under key, expiring after ttl seconds (default 7 days)."""
+    now = int(time.time())
+    try:
+        with _lock:
+            _db().execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, response, now, now + ttl),
+            )
+            _db().commit()
+    except sqlite3.Error:
+        pass
@@ -5,9 +5,27 @@ Supports 20 document categories.
 Includes readability scoring and clause evidence highlighting.
 """
 
-import re
+import re as _std_re
+
+try:
+    # Optional: Google RE2 (via pyre2 / google-re2) guarantees linear-time
+    # matching. Several rules chain unanchored '.*', which the stdlib
+    # backtracker can take quadratic time on for long adversarial inputs.
+    import re2 as re
+except ImportError:
+    try:
+        # Second choice: the 'regex' package — API-compatible with stdlib re
+        # and measurably faster on repeated many-pattern matching.
+        import regex as re
+    except ImportError:
+        import re
+
+import hashlib
 import math
-from dataclasses import dataclass, field
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache, partial
 from typing import List, Optional
 
 
@@ -15,7 +33,7 @@ from typing import List, Optional
 # Data classes
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ReadabilityScore:
     flesch_ease:       float   # 0–100  (higher = easier)
     flesch_grade:      float   # US grade level
@@ -27,7 +45,7 @@ class ReadabilityScore:
     ease_label:        str     # plain English description
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyPoint:
     category:  str
     icon:      str
@@ -37,13 +55,13 @@ class KeyPoint:
     evidence:  List[str] = field(default_factory=list)   # matched sentences
 
 
-@dataclass
+@dataclass(slots=True)
 class RedFlag:
     message:  str
     evidence: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     document_type:    str
     document_summary: str
@@ -59,37 +77,10 @@ class AnalysisResult:
 
     def to_dict(self) -> dict:
         """Serialize to a plain dict (for JSON / session storage)."""
-        d = {
-            "document_type":    self.document_type,
-            "document_summary": self.document_summary,
-            "risk_level":       self.risk_level,
-            "risk_reason":      self.risk_reason,
-            "risk_score":       self.risk_score,
-            "before_signing":   self.before_signing,
-            "word_count":       self.word_count,
-            "char_count":       self.char_count,
-            "key_points": [
-                {"category": kp.category, "icon": kp.icon, "title": kp.title,
-                 "detail": kp.detail, "watch_out": kp.watch_out, "evidence": kp.evidence}
-                for kp in self.key_points
-            ],
-            "red_flags": [
-                {"message": rf.message, "evidence": rf.evidence}
-                for rf in self.red_flags
-            ],
-        }
-        if self.readability:
-            d["readability"] = {
-                "flesch_ease":      self.readability.flesch_ease,
-                "flesch_grade":     self.readability.flesch_grade,
-                "gunning_fog":      self.readability.gunning_fog,
-                "avg_sentence_len": self.readability.avg_sentence_len,
-                "avg_word_len":     self.readability.avg_word_len,
-                "complex_word_pct": self.readability.complex_word_pct,
-                "grade_label":      self.readability.grade_label,
-                "ease_label":       self.readability.ease_label,
-            }
-        return d
+        # asdict handles the nested KeyPoint / RedFlag / ReadabilityScore
+        # conversion in one C-assisted recursive walk; a missing readability
+        # serializes as None rather than an absent key.
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, d: dict) -> "AnalysisResult":
@@ -109,7 +100,7 @@ class AnalysisResult:
                 RedFlag(**rf) for rf in d["red_flags"]
             ],
         )
-        if "readability" in d:
+        if d.get("readability"):
             r.readability = ReadabilityScore(**d["readability"])
         return r
 
@@ -118,24 +109,80 @@ class AnalysisResult:
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _clean(text: str) -> str:
-    return re.sub(r'\s+', ' ', text).strip()
+# Compile-once cache for the raw-string patterns used by _has/_find_evidence.
+# The stdlib re cache holds only 512 entries and still pays a dict probe +
+# argument normalization per call — the analyzer has hundreds of patterns, so
+# compile each one exactly once at first use and call .search() directly.
+_PATTERN_CACHE: dict = {}
 
-def _has(text: str, *patterns: str) -> bool:
-    t = text.lower()
-    return any(re.search(p, t) for p in patterns)
+def _rx(pattern: str) -> "re.Pattern":
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[pattern] = re.compile(pattern, re.IGNORECASE)
+    return compiled
 
-def _find_evidence(text: str, *patterns: str, max_results: int = 2) -> List[str]:
-    """Return up to max_results sentences that contain any of the patterns."""
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    found, seen = [], set()
-    for s in sentences:
+# RE2 has no lookbehind — keep this one on the stdlib engine.
+_SENT_SPLIT_RE = _std_re.compile(r'(?<=[.!?])\s+')
+
+def _clean(text: str) -> str:
+    # split()/join collapses whitespace runs in C — same result as the old
+    # re.sub(r'\s+', ' ', ...).strip(), several times faster.
+    return ' '.join(text.split())
+
+# Two-stage gate: patterns without metacharacters are plain substrings, and
+# str.__contains__ (C memmem-style search) beats the regex engine by an order
+# of magnitude for those. Only true regexes fall through to re.
+_META_RE   = _std_re.compile(r'[\\^$.|?*+()\[\]{}]')
+_GATE_CACHE: dict = {}
+
+def _gate(pattern: str):
+    """Return a plain lowercase substring, or a compiled .search bound method."""
+    g = _GATE_CACHE.get(pattern)
+    if g is None:
+        g = pattern if not _META_RE.search(pattern) else _rx(pattern).search
+        _GATE_CACHE[pattern] = g
+    return g
+
+def _has(low: str, *patterns: str) -> bool:
+    # Expects the caller to pass pre-lowercased text — analyze() lowers the
+    # document exactly once instead of every gate re-copying it.
+    for p in patterns:
+        g = _gate(p)
+        if g.__class__ is str:
+            if g in low:
+                return True
+        elif g(low):
+            return True
+    return False
+
+def _split_sentences(text: str) -> List[tuple]:
+    """Segment once per document: (cleaned sentence, dedup hash) pairs.
+
+    Evidence lookups run ~20× per document; sharing this list amortizes the
+    split, cleaning and key normalization across all of them.
+    """
+    out = []
+    for s in _SENT_SPLIT_RE.split(text):
         s = _clean(s)
         if len(s) < 20 or len(s) > 500:
             continue
-        if any(re.search(p, s, re.IGNORECASE) for p in patterns):
+        # s is already whitespace-collapsed; an int hash of the lowered
+        # 80-char prefix is all the dedup set needs.
+        out.append((s, hash(s[:80].lower())))
+    return out
+
+def _find_evidence(sentences: List[tuple], *patterns,
+                   max_results: int = 2) -> List[str]:
+    """Return up to max_results sentences that contain any of the patterns.
+
+    Accepts raw strings or pre-compiled patterns; tables that run every
+    request precompile theirs at import to skip even the cache probe.
+    """
+    compiled = [_rx(p) if p.__class__ is str else p for p in patterns]
+    found, seen = [], set()
+    for s, key in sentences:
+        if any(p.search(s) for p in compiled):
             # Deduplicate by normalized form
-            key = re.sub(r'\s+', ' ', s.lower()[:80])
             if key not in seen:
                 seen.add(key)
                 found.append(s)
@@ -148,36 +195,81 @@ def _find_evidence(text: str, *patterns: str, max_results: int = 2) -> List[str]
 # Readability scoring  (pure Python — no external libraries)
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Byte-level lookup tables for the syllable scanner. Words are short and hot
+# (one call per word token), so the old three-regex implementation spent most
+# of its time on engine setup rather than matching.
+_NON_ALPHA_BYTES = bytes(c for c in range(256) if not 0x61 <= c <= 0x7A)
+# Maps every byte to \x01 (vowel) or \x00 (consonant) so vowel-group counting
+# happens entirely in C: a group start is a \x00→\x01 transition.
+_VOWEL_MAP = bytes(1 if c in b'aeiouy' else 0 for c in range(256))
+
+# One tokenizer pass instead of separate sentence-split and word-findall
+# passes: group 1 = word, group 2 = sentence terminator run, group 3 = any
+# other non-space run (keeps sentence counting identical — a segment with no
+# letters, e.g. "123", still counts as a sentence).
+_TOKEN_RE = re.compile(r"([a-zA-Z']+)|([.!?]+)|([^\sa-zA-Z'.!?]+)")
+
+@lru_cache(maxsize=8192)
 def _count_syllables(word: str) -> int:
     """Heuristic syllable counter — accurate enough for relative scoring."""
-    word = re.sub(r'[^a-z]', '', word.lower())
-    if not word:
+    b = word.lower().encode('ascii', 'ignore').translate(None, _NON_ALPHA_BYTES)
+    if not b:
         return 1
-    # Count vowel groups (y counts as vowel in middle/end)
-    count = len(re.findall(r'[aeiouy]+', word))
+    # Count vowel groups (y counts as vowel in middle/end) — the translate +
+    # count combination keeps the whole scan in native code.
+    v = b.translate(_VOWEL_MAP)
+    count = v.count(b'\x00\x01') + (v[0] == 1)
     # Silent 'e' at end
-    if word.endswith('e') and len(word) > 2 and word[-2] not in 'aeiou':
+    if b[-1] == 0x65 and len(b) > 2 and b[-2] not in b'aeiou':
         count -= 1
-    # Compound vowels that might be split
-    count += len(re.findall(r'[^aeiouy]ion', word))
+    # Compound vowels that might be split ("-ion" after a consonant)
+    i = b.find(b'ion', 1)
+    while i != -1:
+        if b[i - 1] not in b'aeiouy':
+            count += 1
+            i = b.find(b'ion', i + 4)   # preceding consonant is consumed too
+        else:
+            i = b.find(b'ion', i + 1)
     return max(1, count)
 
 def compute_readability(text: str) -> ReadabilityScore:
-    # Split into sentences and words
-    sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-    words_raw = re.findall(r"[a-zA-Z']+", text)
-
-    num_sentences = max(len(sentences), 1)
-    num_words     = max(len(words_raw), 1)
-
-    syllables = [_count_syllables(w) for w in words_raw]
-    num_syllables = sum(syllables)
-
-    complex_words = [w for w, s in zip(words_raw, syllables) if s >= 3]
-    num_complex   = len(complex_words)
+    # Single pass: tokenize words and sentence terminators together. Words are
+    # tallied into a Counter so the syllable scanner runs once per *unique*
+    # word — legal text is highly repetitive, so unique tokens are a small
+    # fraction of the total.
+    num_sentences = 0
+    in_sentence = False
+    word_counts: Counter = Counter()
+
+    for m in _TOKEN_RE.finditer(text):
+        word = m.group(1)
+        if word:
+            word_counts[word] += 1
+            in_sentence = True
+        elif m.group(2):
+            if in_sentence:
+                num_sentences += 1
+            in_sentence = False
+        else:
+            in_sentence = True
+    if in_sentence:
+        num_sentences += 1
+
+    num_words    = sum(word_counts.values())
+    sum_word_len = 0
+    num_syllables = num_complex = 0
+    for word, n in word_counts.items():
+        sum_word_len += len(word) * n
+        syl = _count_syllables(word)
+        num_syllables += syl * n
+        if syl >= 3:
+            num_complex += n
+
+    num_sentences = max(num_sentences, 1)
+    num_words     = max(num_words, 1)
 
     avg_sentence_len = round(num_words / num_sentences, 1)
-    avg_word_len     = round(sum(len(w) for w in words_raw) / num_words, 1)
+    avg_word_len     = round(sum_word_len / num_words, 1)
     complex_pct      = round(num_complex / num_words * 100, 1)
 
     # Flesch Reading Ease (0–100, higher = easier)
@@ -298,12 +390,73 @@ DOC_TYPE_RULES = [
          r'acceptable use', r'hyperlink', r'web content']),
 ]
 
-def detect_document_type(text: str) -> str:
-    t = text.lower()
-    scores = {dt: sum(len(re.findall(p, t)) for p in pats)
-              for dt, pats in DOC_TYPE_RULES}
-    scores = {k: v for k, v in scores.items() if v > 0}
-    return max(scores, key=scores.get) if scores else "General Terms & Conditions"
+# ── Union-regex fusion ───────────────────────────────────────────────────────
+# Instead of running ~160 separate patterns over the document (one full pass
+# each), fuse them into a single alternation with one named group per category
+# and count matches in a single finditer() pass. Patterns containing an
+# unbounded '.*' are kept on the per-pattern path: inside an alternation a
+# greedy '.*' match would consume a large span and swallow matches that start
+# within it, changing the counts.
+
+def _uncapture(pattern: str) -> str:
+    """Turn capturing groups into non-capturing so m.lastgroup stays reliable.
+
+    Stdlib engine on purpose: the lookahead has no RE2 equivalent, and this
+    only rewrites pattern text at import — nothing RE2 ever executes.
+    """
+    return _std_re.sub(r'\((?!\?)', '(?:', pattern)
+
+def _build_union(groups: dict) -> "re.Pattern":
+    """groups: {group_name: [raw_pattern, ...]} → one compiled alternation.
+
+    Compiled case-sensitive: union scans only ever run against the shared
+    lowered copy of the document, and dropping IGNORECASE lets the engine
+    use its fast literal-prefix search.
+    """
+    parts = [
+        "(?P<%s>%s)" % (name, "|".join(_uncapture(p) for p in pats))
+        for name, pats in groups.items() if pats
+    ]
+    return re.compile("|".join(parts))
+
+# One alternation *per category*, not one across all of them: detection
+# compares match counts between categories, and in a single cross-category
+# union each span is credited to exactly one group — a category whose literal
+# contains another's ('network coverage' vs 'coverage') would steal the
+# shorter category's hits and flip the detected type. Twenty per-category
+# passes keep the counts independent while still replacing ~160 per-pattern
+# passes.
+_DOCTYPE_NAMES      = [dt for dt, _ in DOC_TYPE_RULES]
+_DOCTYPE_UNIONS     = []   # (category index, fused '.*'-free patterns)
+_DOCTYPE_SLOW_RULES = []   # (category index, compiled pattern) for '.*' patterns
+
+for _i, (_dt, _pats) in enumerate(DOC_TYPE_RULES):
+    _fast = [p for p in _pats if ".*" not in p]
+    if _fast:
+        _DOCTYPE_UNIONS.append(
+            (_i, re.compile("|".join("(?:%s)" % p for p in _fast))))
+    _DOCTYPE_SLOW_RULES += [(_i, re.compile(p))
+                            for p in _pats if ".*" in p]
+
+# Keep the compiled per-pattern table available for callers/tests.
+DOC_TYPE_RULES = [
+    (dt, [re.compile(p, re.IGNORECASE) for p in pats])
+    for dt, pats in DOC_TYPE_RULES
+]
+
+def detect_document_type(text: str, low: Optional[str] = None) -> str:
+    t = low if low is not None else text.lower()
+    # Flat per-category counters + one max scan — no per-call dict building.
+    counts = [0] * len(_DOCTYPE_NAMES)
+    for i, u in _DOCTYPE_UNIONS:
+        counts[i] = sum(1 for _ in u.finditer(t))
+    for i, p in _DOCTYPE_SLOW_RULES:
+        counts[i] += sum(1 for _ in p.finditer(t))
+    best_i, best_n = 0, 0
+    for i, n in enumerate(counts):
+        if n > best_n:
+            best_i, best_n = i, n
+    return _DOCTYPE_NAMES[best_i] if best_n else "General Terms & Conditions"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -345,9 +498,25 @@ RISK_PATTERNS = [
     (3,  r'aggregate.*data'),
 ]
 
-def compute_risk(text: str) -> tuple:
-    t = text.lower()
-    score = min(sum(w for w, p in RISK_PATTERNS if re.search(p, t)), 100)
+# Same fusion for risk scoring: one pass detects which of the bounded patterns
+# are present (weights are summed once per pattern, as before); '.*' patterns
+# run individually.
+_RISK_UNION = _build_union({
+    "r%d" % i: [p] for i, (w, p) in enumerate(RISK_PATTERNS) if ".*" not in p
+})
+_RISK_GROUP_WEIGHT = {"r%d" % i: w
+                      for i, (w, p) in enumerate(RISK_PATTERNS) if ".*" not in p}
+_RISK_SLOW_RULES = [(w, re.compile(p))
+                    for w, p in RISK_PATTERNS if ".*" in p]
+
+RISK_PATTERNS = [(w, re.compile(p, re.IGNORECASE)) for w, p in RISK_PATTERNS]
+
+def compute_risk(text: str, low: Optional[str] = None) -> tuple:
+    t = low if low is not None else text.lower()
+    hit_groups = {m.lastgroup for m in _RISK_UNION.finditer(t)}
+    score = sum(_RISK_GROUP_WEIGHT[g] for g in hit_groups)
+    score += sum(w for w, p in _RISK_SLOW_RULES if p.search(t))
+    score = min(score, 100)
     if score >= 50:
         return "High", "Contains several aggressive clauses — liability waivers, arbitration requirements, or data-sharing terms.", score
     elif score >= 25:
@@ -359,214 +528,324 @@ def compute_risk(text: str) -> tuple:
 # Key point detectors  (each now also collects evidence sentences)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _detect_payment(text):
-    if not _has(text, r'payment', r'billing', r'charge', r'fee', r'price'):
-        return None
-    watch, parts = False, []
-    if _has(text, r'automat\w+ (charge|bill|renew)'):
-        parts.append("Payments may be charged automatically."); watch = True
-    if _has(text, r'price.*change', r'adjust.*price', r'modify.*fee'):
-        parts.append("Prices can change — check for notice requirements."); watch = True
-    if _has(text, r'late.*fee', r'penalty.*payment'):
-        parts.append("Late payment fees or penalties may apply."); watch = True
-    detail = parts[0] if parts else "Document includes payment or billing terms."
-    evidence = _find_evidence(text, r'payment', r'billing', r'charge', r'fee')
-    return KeyPoint("Payment & Billing", "💳", "Payment Terms", detail, watch, evidence)
-
-def _detect_renewal(text):
-    if not _has(text, r'auto.?renew', r'automatically renew', r'renew.*subscription'):
-        return None
-    evidence = _find_evidence(text, r'auto.?renew', r'automatically renew')
-    return KeyPoint("Auto-Renewal", "🔄", "Automatic Renewal",
-        "Your subscription may renew automatically. Check how far in advance you must cancel.", True, evidence)
+# ── Shared gate scan ─────────────────────────────────────────────────────────
+# Every detector used to open with its own _has() gate — twenty independent
+# full-document scans even when nothing matched. The gates live in one table
+# now; a single union pass over the lowered document computes the set of
+# detectors whose gate fires, and each _detect_* just checks membership.
+
+_GATE_PATTERNS = {
+    "payment":       (r'payment', r'billing', r'charge', r'fee', r'price'),
+    "renewal":       (r'auto.?renew', r'automatically renew', r'renew.*subscription'),
+    "cancellation":  (r'cancel', r'terminat', r'end.*subscription'),
+    "refund":        (r'refund', r'money.back', r'chargeback'),
+    "privacy":       (r'personal (data|information)', r'privacy', r'collect.*data'),
+    "cookies":       (r'cookie', r'tracking', r'web beacon', r'pixel'),
+    "liability":     (r'liability', r'liable', r'indemnif'),
+    "arbitration":   (r'arbitrat', r'class action', r'dispute resolution', r'jurisdiction'),
+    "ip":            (r'intellectual property', r'copyright', r'trademark',
+                      r'content.*license', r'user.generated'),
+    "termination":   (r'terminat.*account', r'suspend.*account', r'sole.*discretion'),
+    "changes":       (r'modif.*terms', r'change.*terms', r'amend.*agreement', r'update.*terms'),
+    "governing_law": (r'governing law', r'jurisdiction', r'laws of the state'),
+    "non_compete":   (r'non.compete', r'non.solicit', r'restraint of trade'),
+    "loan_default":  (r'default', r'acceleration', r'foreclosure', r'repossess'),
+    "health":        (r'hipaa', r'health.*data', r'medical.*record', r'protected health', r'\bphi\b'),
+    "telecom":       (r'roaming', r'data cap', r'fair use', r'throttl', r'network management'),
+    "deposit":       (r'security deposit', r'bond\b', r'damage.*deposit'),
+    "force_majeure": (r'force majeure', r'act of god', r'beyond.*control', r'unforeseeable'),
+    "sla":           (r'\bsla\b', r'service level', r'uptime', r'availability.*%', r'downtime'),
+    "age":           (r'(\d+)\s*years? of age', r'must be\s*\d+', r'age.*requirement', r'minors?'),
+}
 
-def _detect_cancellation(text):
-    if not _has(text, r'cancel', r'terminat', r'end.*subscription'):
-        return None
-    watch = False
-    if _has(text, r'no refund', r'non.refundable'):
-        detail, watch = "Cancellations may not entitle you to a refund.", True
-    elif _has(text, r'cancel.*any time', r'anytime'):
-        detail = "You can cancel at any time, but verify whether unused periods are refunded."
-    elif _has(text, r'notice.*cancel', r'cancel.*notice'):
-        detail, watch = "A notice period may be required before cancellation takes effect.", True
+# A pattern declared by several features (r'jurisdiction' gates both
+# "arbitration" and "governing_law") breaks the one-group-per-feature scheme:
+# the fused alternation credits each match to exactly one named group, so the
+# later feature would never fire. Shared patterns therefore get a group of
+# their own, and _scan_gates expands every group hit to the full set of
+# features that declared the pattern.
+_gate_owners: dict = {}   # pattern → [features declaring it], declaration order
+for _feat, _pats in _GATE_PATTERNS.items():
+    for _p in _pats:
+        if ".*" not in _p:
+            _gate_owners.setdefault(_p, []).append(_feat)
+
+_gate_groups         = {feat: [] for feat in _GATE_PATTERNS}
+_GATE_GROUP_FEATURES = {feat: (feat,) for feat in _GATE_PATTERNS}
+for _i, (_p, _feats) in enumerate(_gate_owners.items()):
+    if len(_feats) == 1:
+        _gate_groups[_feats[0]].append(_p)
     else:
-        detail = "Cancellation terms are defined in this document."
-    evidence = _find_evidence(text, r'cancel\w*', r'terminat\w*')
-    return KeyPoint("Cancellation", "❌", "Cancellation Policy", detail, watch, evidence)
+        _name = "shared%d" % _i
+        _gate_groups[_name] = [_p]
+        _GATE_GROUP_FEATURES[_name] = tuple(_feats)
+
+_GATE_UNION = _build_union(_gate_groups)
+
+def _scan_gates(low: str) -> set:
+    """Union pass over the lowered document → set of detector gates that fire.
+
+    The union only ever produces true positives; a feature it misses is not
+    proof of absence, because finditer is non-overlapping and one gate's
+    pattern can consume the prefix of another's (payment's 'charge' swallows
+    refund's 'chargeback'). Gates still unfired after the pass — including
+    the '.*' patterns the union excludes — are re-checked on the per-pattern
+    _has path, so fired gates (the common case) skip ~all of their scans and
+    unfired ones cost what they always did.
+    """
+    hits: set = set()
+    group_features = _GATE_GROUP_FEATURES
+    for m in _GATE_UNION.finditer(low):
+        hits.update(group_features[m.lastgroup])
+    for feat, pats in _GATE_PATTERNS.items():
+        if feat not in hits and _has(low, *pats):
+            hits.add(feat)
+    return hits
+
+# Detail-extraction patterns used by individual detectors, compiled once.
+# _JURISDICTION_RE is deliberately case-sensitive — it keys off capitalized
+# place names.
+_JURISDICTION_RE        = re.compile(r'laws? of (the )?([A-Z][a-z]+(?:\s[A-Z][a-z]+)?)')
+_REFUND_WINDOW_RE       = re.compile(r'(\d+).day', re.IGNORECASE)
+_RESTRICTION_PERIOD_RE  = re.compile(r'(\d+)\s*(month|year)', re.IGNORECASE)
+_UPTIME_PCT_RE          = re.compile(r'(\d{2,3}(?:\.\d+)?)\s*%')
+_AGE_RE                 = re.compile(r'(\d+)\s*years? of age|must be (\d+)', re.IGNORECASE)
+
+# ── Declarative detectors ────────────────────────────────────────────────────
+# Most detectors share one shape: gate membership check → ordered rules where
+# the first matching pattern group sets detail/watch → a default detail →
+# evidence collection. Those live in _DETECTOR_TABLE now; _run_spec is the
+# single interpreter that walks a spec. Detectors that extract values with
+# their own regexes or compose details from several matches (refund windows,
+# liability + indemnity, SLA percentages…) remain ordinary functions below.
+#
+# Spec layout:
+#   (gate, rules, default_detail, default_watch, evidence_patterns,
+#    category, icon, title)
+# where rules = ((patterns…), detail, watch) tried in order.
+
+_DETECTOR_TABLE = [
+    ("payment",
+     (((r'automat\w+ (charge|bill|renew)',),
+       "Payments may be charged automatically.", True),
+      ((r'price.*change', r'adjust.*price', r'modify.*fee'),
+       "Prices can change — check for notice requirements.", True),
+      ((r'late.*fee', r'penalty.*payment'),
+       "Late payment fees or penalties may apply.", True)),
+     "Document includes payment or billing terms.", False,
+     (r'payment', r'billing', r'charge', r'fee'),
+     "Payment & Billing", "💳", "Payment Terms"),
+
+    ("renewal",
+     (),
+     "Your subscription may renew automatically. Check how far in advance you must cancel.", True,
+     (r'auto.?renew', r'automatically renew'),
+     "Auto-Renewal", "🔄", "Automatic Renewal"),
+
+    ("cancellation",
+     (((r'no refund', r'non.refundable'),
+       "Cancellations may not entitle you to a refund.", True),
+      ((r'cancel.*any time', r'anytime'),
+       "You can cancel at any time, but verify whether unused periods are refunded.", False),
+      ((r'notice.*cancel', r'cancel.*notice'),
+       "A notice period may be required before cancellation takes effect.", True)),
+     "Cancellation terms are defined in this document.", False,
+     (r'cancel\w*', r'terminat\w*'),
+     "Cancellation", "❌", "Cancellation Policy"),
+
+    ("privacy",
+     (((r'sell.*data', r'third.party.*sell'),
+       "Your personal data may be sold to third parties.", True),
+      ((r'share.*third.part', r'third.part.*share'),
+       "Your data may be shared with third parties — check which ones and why.", True),
+      ((r'gdpr', r'ccpa'),
+       "GDPR/CCPA-compliant data handling is referenced.", False)),
+     "The document describes how your personal data is handled.", False,
+     (r'personal (data|information)', r'collect.*data', r'share.*data'),
+     "Privacy & Data", "🔒", "Data & Privacy"),
+
+    ("cookies",
+     (((r'third.party.*cookie', r'advertis.*cookie'),
+       "Third-party and advertising cookies may be placed on your device.", True),),
+     "Cookies and tracking technologies are used.", False,
+     (r'cookie', r'tracking', r'web beacon'),
+     "Cookies & Tracking", "🍪", "Cookies & Tracking"),
+
+    ("ip",
+     (((r'grant.*license.*content', r'royalty.free', r'perpetual.*license'),
+       "You grant the platform a broad license to use your content.", True),),
+     "Intellectual property ownership is addressed.", False,
+     (r'intellectual property', r'copyright', r'license.*content'),
+     "Intellectual Property", "©️", "Content & IP Rights"),
+
+    ("changes",
+     (((r'without.*notice', r'at any time.*modif'),
+       "Terms can be changed at any time without notice — continued use implies acceptance.", True),),
+     "The provider can update these terms over time.", False,
+     (r'modif.*terms', r'change.*terms', r'amend.*agreement'),
+     "Terms Changes", "📝", "Right to Modify Terms"),
+
+    ("loan_default",
+     (),
+     "The document outlines consequences for default — this may include acceleration of full repayment, asset seizure, or foreclosure.", True,
+     (r'default', r'foreclosure', r'repossess', r'acceleration'),
+     "Default & Consequences", "💥", "Default Provisions"),
+
+    ("health",
+     (((r'share.*health', r'disclose.*health', r'third.*health'),
+       "Your health data may be shared with third parties — verify scope and purpose.", True),),
+     "Health data is involved. HIPAA or equivalent protections may apply.", False,
+     (r'hipaa', r'health.*data', r'medical.*record'),
+     "Health Data", "🏥", "Health & Medical Data"),
+
+    ("deposit",
+     (),
+     "A security deposit is required. Review the conditions under which it can be withheld or deducted.", True,
+     (r'security deposit', r'bond', r'deposit'),
+     "Security Deposit", "🏦", "Security Deposit"),
+
+    ("force_majeure",
+     (),
+     "A force majeure clause limits the provider's obligations during extraordinary events (natural disasters, pandemics, etc.).", False,
+     (r'force majeure', r'act of god', r'beyond.*control'),
+     "Force Majeure", "🌪️", "Force Majeure"),
+]
+
+# Evidence patterns run every request — precompile them into the specs.
+_DETECTOR_TABLE = [
+    (gate, rules, detail, watch, tuple(_rx(p) for p in ev_pats),
+     category, icon, title)
+    for gate, rules, detail, watch, ev_pats, category, icon, title
+    in _DETECTOR_TABLE
+]
+_SPEC_BY_GATE = {spec[0]: spec for spec in _DETECTOR_TABLE}
+
+def _run_spec(spec, text, low, sentences, hits):
+    """Interpret one _DETECTOR_TABLE spec — the shared detector shape."""
+    gate, rules, detail, watch, ev_pats, category, icon, title = spec
+    if gate not in hits:
+        return None
+    for pats, rule_detail, rule_watch in rules:
+        if _has(low, *pats):
+            detail, watch = rule_detail, rule_watch
+            break
+    evidence = _find_evidence(sentences, *ev_pats)
+    return KeyPoint(category, icon, title, detail, watch, evidence)
+
+def _spec_detector(gate):
+    return partial(_run_spec, _SPEC_BY_GATE[gate])
 
-def _detect_refund(text):
-    if not _has(text, r'refund', r'money.back', r'chargeback'):
+def _detect_refund(text, low, sentences, hits):
+    if "refund" not in hits:
         return None
-    evidence = _find_evidence(text, r'refund', r'money.back')
-    if _has(text, r'no refund', r'non.refundable', r'all sales final'):
+    evidence = _find_evidence(sentences, r'refund', r'money.back')
+    if _has(low, r'no refund', r'non.refundable', r'all sales final'):
         return KeyPoint("Refunds", "💰", "Refund Policy",
             "No refunds are available — all purchases are final.", True, evidence)
-    m = re.search(r'(\d+).day', text, re.IGNORECASE)
+    m = _REFUND_WINDOW_RE.search(text)
     detail = f"A {m.group(1)}-day refund window is offered — verify the conditions." if m else "Refund terms are addressed."
     return KeyPoint("Refunds", "💰", "Refund Policy", detail, False, evidence)
 
-def _detect_data_privacy(text):
-    if not _has(text, r'personal (data|information)', r'privacy', r'collect.*data'):
+def _detect_liability(text, low, sentences, hits):
+    if "liability" not in hits:
         return None
-    evidence = _find_evidence(text, r'personal (data|information)', r'collect.*data', r'share.*data')
-    if _has(text, r'sell.*data', r'third.party.*sell'):
-        return KeyPoint("Privacy & Data", "🔒", "Data & Privacy",
-            "Your personal data may be sold to third parties.", True, evidence)
-    if _has(text, r'share.*third.part', r'third.part.*share'):
-        return KeyPoint("Privacy & Data", "🔒", "Data & Privacy",
-            "Your data may be shared with third parties — check which ones and why.", True, evidence)
-    detail = "GDPR/CCPA-compliant data handling is referenced." if _has(text, r'gdpr', r'ccpa') else "The document describes how your personal data is handled."
-    return KeyPoint("Privacy & Data", "🔒", "Data & Privacy", detail, False, evidence)
-
-def _detect_cookies(text):
-    if not _has(text, r'cookie', r'tracking', r'web beacon', r'pixel'):
-        return None
-    evidence = _find_evidence(text, r'cookie', r'tracking', r'web beacon')
-    watch = _has(text, r'third.party.*cookie', r'advertis.*cookie')
-    detail = "Third-party and advertising cookies may be placed on your device." if watch else "Cookies and tracking technologies are used."
-    return KeyPoint("Cookies & Tracking", "🍪", "Cookies & Tracking", detail, watch, evidence)
-
-def _detect_liability(text):
-    if not _has(text, r'liability', r'liable', r'indemnif'):
-        return None
-    evidence = _find_evidence(text, r'liabilit', r'indemnif')
+    evidence = _find_evidence(sentences, r'liabilit', r'indemnif')
     watch = False
-    if _has(text, r'unlimited liability'):
+    if _has(low, r'unlimited liability'):
         detail, watch = "You may be exposed to unlimited financial liability.", True
-    elif _has(text, r'limitation of liability', r'not liable'):
+    elif _has(low, r'limitation of liability', r'not liable'):
         detail, watch = "The provider limits its own liability — you may have limited recourse for damages.", True
     else:
         detail = "The document includes liability clauses."
-    if _has(text, r'indemnif'):
+    if _has(low, r'indemnif'):
         detail += " You may be required to indemnify the provider against third-party claims."
         watch = True
     return KeyPoint("Liability", "⚠️", "Liability & Indemnification", detail, watch, evidence)
 
-def _detect_arbitration(text):
-    if not _has(text, r'arbitrat', r'class action', r'dispute resolution', r'jurisdiction'):
+def _detect_arbitration(text, low, sentences, hits):
+    if "arbitration" not in hits:
         return None
-    evidence = _find_evidence(text, r'arbitrat', r'class action', r'dispute')
+    evidence = _find_evidence(sentences, r'arbitrat', r'class action', r'dispute')
     watch = False
     detail = "Dispute resolution procedures are outlined."
-    if _has(text, r'binding arbitration'):
+    if _has(low, r'binding arbitration'):
         detail, watch = "You must use binding arbitration to resolve disputes — you may not sue in court.", True
-    if _has(text, r'class action waiver'):
+    if _has(low, r'class action waiver'):
         detail += " Class action lawsuits are waived."; watch = True
     return KeyPoint("Dispute Resolution", "⚖️", "Disputes & Arbitration", detail, watch, evidence)
 
-def _detect_ip(text):
-    if not _has(text, r'intellectual property', r'copyright', r'trademark', r'content.*license', r'user.generated'):
+def _detect_termination(text, low, sentences, hits):
+    if "termination" not in hits:
         return None
-    evidence = _find_evidence(text, r'intellectual property', r'copyright', r'license.*content')
-    watch = _has(text, r'grant.*license.*content', r'royalty.free', r'perpetual.*license')
-    detail = "You grant the platform a broad license to use your content." if watch else "Intellectual property ownership is addressed."
-    return KeyPoint("Intellectual Property", "©️", "Content & IP Rights", detail, watch, evidence)
-
-def _detect_termination(text):
-    if not _has(text, r'terminat.*account', r'suspend.*account', r'sole.*discretion'):
-        return None
-    evidence = _find_evidence(text, r'terminat.*account', r'suspend.*account', r'sole.*discretion')
+    evidence = _find_evidence(sentences, r'terminat.*account', r'suspend.*account', r'sole.*discretion')
     watch = False
     detail = "The provider can terminate or suspend accounts under defined conditions."
-    if _has(text, r'without (prior )?notice') and _has(text, r'terminat'):
+    if _has(low, r'without (prior )?notice') and _has(low, r'terminat'):
         detail, watch = "Your account may be terminated without prior notice at their discretion.", True
     return KeyPoint("Account Termination", "🚫", "Account Suspension / Termination", detail, watch, evidence)
 
-def _detect_changes(text):
-    if not _has(text, r'modif.*terms', r'change.*terms', r'amend.*agreement', r'update.*terms'):
-        return None
-    evidence = _find_evidence(text, r'modif.*terms', r'change.*terms', r'amend.*agreement')
-    watch = _has(text, r'without.*notice', r'at any time.*modif')
-    detail = "Terms can be changed at any time without notice — continued use implies acceptance." if watch else "The provider can update these terms over time."
-    return KeyPoint("Terms Changes", "📝", "Right to Modify Terms", detail, watch, evidence)
-
-def _detect_governing_law(text):
-    if not _has(text, r'governing law', r'jurisdiction', r'laws of the state'):
+def _detect_governing_law(text, low, sentences, hits):
+    if "governing_law" not in hits:
         return None
-    m = re.search(r'laws? of (the )?([A-Z][a-z]+(?:\s[A-Z][a-z]+)?)', text)
+    m = _JURISDICTION_RE.search(text)
     j = m.group(2) if m else "a specific jurisdiction"
-    evidence = _find_evidence(text, r'governing law', r'jurisdiction')
+    evidence = _find_evidence(sentences, r'governing law', r'jurisdiction')
     return KeyPoint("Governing Law", "🏛️", "Applicable Law & Jurisdiction",
         f"This agreement is governed by the laws of {j}. Disputes may need to be resolved there.", False, evidence)
 
-def _detect_non_compete(text):
-    if not _has(text, r'non.compete', r'non.solicit', r'restraint of trade'):
+def _detect_non_compete(text, low, sentences, hits):
+    if "non_compete" not in hits:
         return None
     detail = "A non-compete or non-solicitation clause is present — you may be restricted from working for competitors."
-    m = re.search(r'(\d+)\s*(month|year)', text, re.IGNORECASE)
+    m = _RESTRICTION_PERIOD_RE.search(text)
     if m: detail += f" The restriction period appears to be {m.group(1)} {m.group(2)}(s)."
-    evidence = _find_evidence(text, r'non.compete', r'non.solicit', r'restraint of trade')
+    evidence = _find_evidence(sentences, r'non.compete', r'non.solicit', r'restraint of trade')
     return KeyPoint("Non-Compete", "🚷", "Non-Compete Clause", detail, True, evidence)
 
-def _detect_loan_default(text):
-    if not _has(text, r'default', r'acceleration', r'foreclosure', r'repossess'):
+def _detect_telecom(text, low, sentences, hits):
+    if "telecom" not in hits:
         return None
-    evidence = _find_evidence(text, r'default', r'foreclosure', r'repossess', r'acceleration')
-    return KeyPoint("Default & Consequences", "💥", "Default Provisions",
-        "The document outlines consequences for default — this may include acceleration of full repayment, asset seizure, or foreclosure.", True, evidence)
-
-def _detect_health_data(text):
-    if not _has(text, r'hipaa', r'health.*data', r'medical.*record', r'protected health', r'\bphi\b'):
-        return None
-    evidence = _find_evidence(text, r'hipaa', r'health.*data', r'medical.*record')
-    watch = _has(text, r'share.*health', r'disclose.*health', r'third.*health')
-    detail = "Your health data may be shared with third parties — verify scope and purpose." if watch else "Health data is involved. HIPAA or equivalent protections may apply."
-    return KeyPoint("Health Data", "🏥", "Health & Medical Data", detail, watch, evidence)
-
-def _detect_telecom(text):
-    if not _has(text, r'roaming', r'data cap', r'fair use', r'throttl', r'network management'):
-        return None
-    evidence = _find_evidence(text, r'roaming', r'throttl', r'data cap')
+    evidence = _find_evidence(sentences, r'roaming', r'throttl', r'data cap')
     watch = False
     detail = "Network usage policies are defined."
-    if _has(text, r'throttl', r'speed.*reduc'):
+    if _has(low, r'throttl', r'speed.*reduc'):
         detail, watch = "Your data speeds may be throttled after exceeding a usage threshold.", True
-    if _has(text, r'roaming'):
+    if _has(low, r'roaming'):
         detail += " Roaming charges may apply outside your home network."; watch = True
     return KeyPoint("Network & Roaming", "📡", "Data Limits & Roaming", detail, watch, evidence)
 
-def _detect_security_deposit(text):
-    if not _has(text, r'security deposit', r'bond\b', r'damage.*deposit'):
-        return None
-    evidence = _find_evidence(text, r'security deposit', r'bond', r'deposit')
-    return KeyPoint("Security Deposit", "🏦", "Security Deposit",
-        "A security deposit is required. Review the conditions under which it can be withheld or deducted.", True, evidence)
-
-def _detect_force_majeure(text):
-    if not _has(text, r'force majeure', r'act of god', r'beyond.*control', r'unforeseeable'):
+def _detect_sla(text, low, sentences, hits):
+    if "sla" not in hits:
         return None
-    evidence = _find_evidence(text, r'force majeure', r'act of god', r'beyond.*control')
-    return KeyPoint("Force Majeure", "🌪️", "Force Majeure",
-        "A force majeure clause limits the provider's obligations during extraordinary events (natural disasters, pandemics, etc.).", False, evidence)
-
-def _detect_sla(text):
-    if not _has(text, r'\bsla\b', r'service level', r'uptime', r'availability.*%', r'downtime'):
-        return None
-    evidence = _find_evidence(text, r'uptime', r'service level', r'downtime')
-    m = re.search(r'(\d{2,3}(?:\.\d+)?)\s*%', text)
+    evidence = _find_evidence(sentences, r'uptime', r'service level', r'downtime')
+    m = _UPTIME_PCT_RE.search(text)
     uptime = f"{m.group(1)}%" if m else "a defined"
-    watch = _has(text, r'no credit', r'sole remedy.*credit', r'not liable.*downtime')
+    watch = _has(low, r'no credit', r'sole remedy.*credit', r'not liable.*downtime')
     detail = f"An SLA guarantees {uptime} uptime."
     if watch: detail += " However, compensation for downtime may be limited to service credits only."
     return KeyPoint("Service Level", "📊", "Uptime & SLA Guarantee", detail, watch, evidence)
 
-def _detect_age_restriction(text):
-    if not _has(text, r'(\d+)\s*years? of age', r'must be\s*\d+', r'age.*requirement', r'minors?'):
+def _detect_age_restriction(text, low, sentences, hits):
+    if "age" not in hits:
         return None
-    m = re.search(r'(\d+)\s*years? of age|must be (\d+)', text, re.IGNORECASE)
+    m = _AGE_RE.search(text)
     age = m.group(1) or m.group(2) if m else "a minimum"
-    evidence = _find_evidence(text, r'years? of age', r'must be \d+', r'minor')
+    evidence = _find_evidence(sentences, r'years? of age', r'must be \d+', r'minor')
     return KeyPoint("Age Restriction", "🔞", "Age Requirement",
         f"Users must be at least {age} years old. Parental consent may be required for minors.", False, evidence)
 
 
+# Canonical key-point order — spec-driven and hand-written detectors mixed.
 DETECTORS = [
-    _detect_payment, _detect_renewal, _detect_cancellation, _detect_refund,
-    _detect_data_privacy, _detect_cookies, _detect_liability, _detect_arbitration,
-    _detect_ip, _detect_termination, _detect_changes, _detect_governing_law,
-    _detect_non_compete, _detect_loan_default, _detect_health_data,
-    _detect_telecom, _detect_security_deposit, _detect_force_majeure,
+    _spec_detector("payment"), _spec_detector("renewal"),
+    _spec_detector("cancellation"), _detect_refund,
+    _spec_detector("privacy"), _spec_detector("cookies"),
+    _detect_liability, _detect_arbitration,
+    _spec_detector("ip"), _detect_termination,
+    _spec_detector("changes"), _detect_governing_law,
+    _detect_non_compete, _spec_detector("loan_default"),
+    _spec_detector("health"), _detect_telecom,
+    _spec_detector("deposit"), _spec_detector("force_majeure"),
     _detect_sla, _detect_age_restriction,
 ]
 
@@ -579,36 +858,99 @@ RED_FLAG_RULES = [
     (r'sell.*personal (data|information)',          "May sell your personal data to third parties.",              [r'sell.*personal', r'personal.*sold']),
     (r'share.*with.*third.part',                    "Your data may be shared with unspecified third parties.",   [r'share.*third', r'third.part.*receiv']),
     (r'track.*location',                            "Your location data may be tracked.",                        [r'track.*location', r'location.*track']),
-    (r'monitor.*communication',                     "Provider may monitor your private communications.",         [r'monitor.*communicat']),
+    (r'monitor.*communication',                     "Provider may monitor your private communications.",         None),
     (r'class action waiver',                        "Waives your right to participate in class action lawsuits.",[r'class action']),
     (r'binding arbitration',                        "Requires binding arbitration — limits your ability to sue.",[r'binding arbitration', r'arbitrat']),
     (r'waive.*right',                               "Contains clauses where you waive important legal rights.",  [r'waive.*right', r'right.*waiv']),
-    (r'irrevocable.*licen',                         "Grants an irrevocable license over your content.",          [r'irrevocable.*licen']),
+    (r'irrevocable.*licen',                         "Grants an irrevocable license over your content.",          None),
     (r'perpetual.*licen.*royalty.free',             "Grants unlimited, perpetual, royalty-free use of your content.", [r'perpetual.*licen', r'royalty.free']),
     (r'no refund|non.refundable|all sales final',   "No refunds under any circumstances.",                       [r'no refund', r'non.refundable']),
     (r'accelerat.*repayment|full.*amount.*due',     "Default may trigger immediate repayment of full balance.",  [r'accelerat', r'full.*amount.*due']),
-    (r'wage.*garnish',                              "Wages may be garnished in case of default.",                [r'wage.*garnish']),
+    (r'wage.*garnish',                              "Wages may be garnished in case of default.",                None),
     (r'(modif|change|amend).*without.*notice',      "Terms can be changed without notifying you.",               [r'without.*notice', r'change.*terms']),
-    (r'terminat.*without (prior )?notice',          "Account can be terminated without any notice.",             [r'terminat.*without.*notice']),
-    (r'at our sole discretion',                     "Provider has unchecked discretion on key decisions.",       [r'sole discretion']),
-    (r'unilateral.*modif',                          "Provider can unilaterally modify the agreement.",           [r'unilateral']),
+    (r'terminat.*without (prior )?notice',          "Account can be terminated without any notice.",             None),
+    (r'at our sole discretion',                     "Provider has unchecked discretion on key decisions.",       None),
+    (r'unilateral.*modif',                          "Provider can unilaterally modify the agreement.",           None),
     (r'not responsible.*any (loss|damage)',         "Provider disclaims all responsibility for losses.",         [r'not responsible.*loss', r'not liable.*damage']),
     (r'indemnif.*attorney.*fees',                   "You may be liable for the provider's legal fees.",          [r'indemnif.*attorney', r'attorney.*fees']),
-    (r'foreclosure',                                "Non-payment may result in foreclosure of your property.",   [r'foreclosure']),
-    (r'non.compete.*(\d+)\s*year',                  "Non-compete clause restricts you for a multi-year period.", [r'non.compete.*year']),
-    (r'cross.default',                              "Default on one obligation may trigger default on all.",     [r'cross.default']),
-    (r'repossess',                                  "Assets may be repossessed in case of default.",             [r'repossess']),
+    (r'foreclosure',                                "Non-payment may result in foreclosure of your property.",   None),
+    (r'non.compete.*(\d+)\s*year',                  "Non-compete clause restricts you for a multi-year period.", None),
+    (r'cross.default',                              "Default on one obligation may trigger default on all.",     None),
+    (r'repossess',                                  "Assets may be repossessed in case of default.",             None),
+]
+
+# Same set-scan fusion as risk/gates: bounded triggers collapse into one
+# alternation answering "which rules fired" in a single pass over the
+# document; '.*' triggers run individually so their greedy spans cannot
+# swallow other rules' matches. Triggers match the shared lowered copy only —
+# case-sensitive compile keeps the engine's literal-prefix fast path
+# available. Evidence patterns match original-case sentences, so they go
+# through _rx (IGNORECASE) once here.
+_RED_FLAG_UNION = _build_union({
+    "f%d" % i: [t]
+    for i, (t, _m, _e) in enumerate(RED_FLAG_RULES) if ".*" not in t
+})
+_RED_FLAG_GROUP_INDEX = {"f%d" % i: i
+                         for i, (t, _m, _e) in enumerate(RED_FLAG_RULES)
+                         if ".*" not in t}
+_RED_FLAG_SLOW_RULES = [(i, re.compile(t))
+                        for i, (t, _m, _e) in enumerate(RED_FLAG_RULES)
+                        if ".*" in t]
+
+# evidence_pats=None: the trigger match itself is the evidence — the scan
+# already knows its span, so no separate sentence search is needed.
+RED_FLAG_RULES = [
+    (re.compile(trigger), message,
+     None if evidence_pats is None else [_rx(p) for p in evidence_pats])
+    for trigger, message, evidence_pats in RED_FLAG_RULES
 ]
 
-def detect_red_flags(text: str) -> List[RedFlag]:
-    t = text.lower()
+# A message appears at most once in the output, so rules sharing a message
+# collapse into one group at import — no runtime seen_messages set. All
+# current messages are unique (one index per group); the grouping keeps the
+# dedup structural if duplicate-message rules are ever added.
+_RED_FLAG_GROUPS = []   # (rule index frozenset, message, evidence_pats)
+_msg_pos: dict = {}
+for _i, (_t, _msg, _ev) in enumerate(RED_FLAG_RULES):
+    if _msg in _msg_pos:
+        _g = _RED_FLAG_GROUPS[_msg_pos[_msg]]
+        _RED_FLAG_GROUPS[_msg_pos[_msg]] = (_g[0] | {_i}, _g[1], _g[2])
+    else:
+        _msg_pos[_msg] = len(_RED_FLAG_GROUPS)
+        _RED_FLAG_GROUPS.append((frozenset({_i}), _msg, _ev))
+del _msg_pos
+
+def detect_red_flags(text: str, low: Optional[str] = None,
+                     sentences: Optional[List[tuple]] = None) -> List[RedFlag]:
+    t = low if low is not None else text.lower()
+    if sentences is None:
+        sentences = _split_sentences(text)
+    group_index = _RED_FLAG_GROUP_INDEX
+    # Keep the first match span per rule — for self-evident rules the span
+    # is the evidence, saving a sentence scan per fired rule.
+    spans = {}
+    for m in _RED_FLAG_UNION.finditer(t):
+        i = group_index[m.lastgroup]
+        if i not in spans:
+            spans[i] = m.span()
+    for i, p in _RED_FLAG_SLOW_RULES:
+        if i not in spans:
+            m = p.search(t)
+            if m:
+                spans[i] = m.span()
     flags = []
-    seen_messages = set()
-    for trigger, message, evidence_pats in RED_FLAG_RULES:
-        if re.search(trigger, t) and message not in seen_messages:
-            seen_messages.add(message)
-            evidence = _find_evidence(text, *evidence_pats)
-            flags.append(RedFlag(message=message, evidence=evidence))
+    for indices, message, evidence_pats in _RED_FLAG_GROUPS:
+        hit_spans = [spans[i] for i in indices if i in spans]
+        if not hit_spans:
+            continue
+        if evidence_pats is None:
+            # t and text share offsets (analyze lowers the cleaned text),
+            # so slice the original-case context around the match.
+            s, e = hit_spans[0]
+            evidence = [text[max(0, s - 40):e + 40].strip()]
+        else:
+            evidence = _find_evidence(sentences, *evidence_pats)
+        flags.append(RedFlag(message=message, evidence=evidence))
     return flags
 
 
@@ -616,31 +958,48 @@ def detect_red_flags(text: str) -> List[RedFlag]:
 # Before-signing checklist
 # ─────────────────────────────────────────────────────────────────────────────
 
-def build_checklist(text: str, doc_type: str, risk_level: str) -> List[str]:
+# (gate patterns, checklist item) in display order. Gates are resolved once
+# at import via _gate — substrings stay plain strings, regexes compile. The
+# None item marks the governing-law entry, which extracts the jurisdiction.
+_CHECKLIST_RULES = [
+    ((r'auto.?renew', r'automatically renew'),
+     "Confirm the auto-renewal date and how to cancel before it triggers."),
+    ((r'binding arbitration',),
+     "Understand that by signing you likely give up your right to sue in court."),
+    ((r'personal data', r'data.*collect'),
+     "Review exactly what personal data is collected and who it is shared with."),
+    ((r'no refund', r'non.refundable'),
+     "Note there are no refunds — be certain before committing."),
+    ((r'foreclosure', r'repossess', r'collateral'),
+     "Understand what assets are at risk if you default on your obligations."),
+    ((r'non.compete', r'non.solicit'),
+     "Review the non-compete clause — it may restrict future employment."),
+    ((r'hipaa', r'health.*data', r'medical.*record'),
+     "Verify how your health data is stored, protected, and who can access it."),
+    ((r'roaming', r'data cap', r'throttl'),
+     "Check data caps, throttling thresholds, and roaming charges carefully."),
+    ((r'governing law', r'jurisdiction'), None),
+    ((r'indemnif',),
+     "Understand the indemnification clause — you may be financially responsible for third-party claims."),
+    ((r'intellectual property', r'license.*content'),
+     "Check what rights you grant to the platform over content you upload."),
+]
+_CHECKLIST_RULES = [(tuple(_gate(p) for p in pats), item)
+                    for pats, item in _CHECKLIST_RULES]
+
+def build_checklist(text: str, doc_type: str, risk_level: str,
+                    low: Optional[str] = None) -> List[str]:
+    low = low if low is not None else text.lower()
     items = []
-    if _has(text, r'auto.?renew', r'automatically renew'):
-        items.append("Confirm the auto-renewal date and how to cancel before it triggers.")
-    if _has(text, r'binding arbitration'):
-        items.append("Understand that by signing you likely give up your right to sue in court.")
-    if _has(text, r'personal data', r'data.*collect'):
-        items.append("Review exactly what personal data is collected and who it is shared with.")
-    if _has(text, r'no refund', r'non.refundable'):
-        items.append("Note there are no refunds — be certain before committing.")
-    if _has(text, r'foreclosure', r'repossess', r'collateral'):
-        items.append("Understand what assets are at risk if you default on your obligations.")
-    if _has(text, r'non.compete', r'non.solicit'):
-        items.append("Review the non-compete clause — it may restrict future employment.")
-    if _has(text, r'hipaa', r'health.*data', r'medical.*record'):
-        items.append("Verify how your health data is stored, protected, and who can access it.")
-    if _has(text, r'roaming', r'data cap', r'throttl'):
-        items.append("Check data caps, throttling thresholds, and roaming charges carefully.")
-    if _has(text, r'governing law', r'jurisdiction'):
-        m = re.search(r'laws? of (the )?([A-Z][a-z]+(?:\s[A-Z][a-z]+)?)', text)
-        if m: items.append(f"Disputes will be handled under {m.group(2)} law — check if this affects you.")
-    if _has(text, r'indemnif'):
-        items.append("Understand the indemnification clause — you may be financially responsible for third-party claims.")
-    if _has(text, r'intellectual property', r'license.*content'):
-        items.append("Check what rights you grant to the platform over content you upload.")
+    for gates, item in _CHECKLIST_RULES:
+        for g in gates:
+            if (g in low) if g.__class__ is str else g(low):
+                if item is not None:
+                    items.append(item)
+                else:
+                    m = _JURISDICTION_RE.search(text)
+                    if m: items.append(f"Disputes will be handled under {m.group(2)} law — check if this affects you.")
+                break
     if risk_level == "High":
         items.append("Given the high risk level, consider having a legal professional review this document.")
     if not items:
@@ -678,9 +1037,9 @@ SUMMARY_TEMPLATES = {
     "General Terms & Conditions": "This is a general Terms & Conditions document outlining the rules, rights, and obligations between you and the provider.",
 }
 
-def build_summary(doc_type: str, text: str) -> str:
+def build_summary(doc_type: str, word_count: int) -> str:
     base = SUMMARY_TEMPLATES.get(doc_type, SUMMARY_TEMPLATES["General Terms & Conditions"])
-    if len(text.split()) > 3000:
+    if word_count > 3000:
         base += " The document is comprehensive — take time to read key sections carefully."
     return base
 
@@ -694,19 +1053,73 @@ def analyze(text: str) -> AnalysisResult:
     if not text:
         raise ValueError("Empty document.")
 
-    doc_type = detect_document_type(text)
-    risk_level, risk_reason, risk_score = compute_risk(text)
+    # Lowercase exactly once — every gate, scorer and detector reads this copy
+    # instead of re-lowering (and re-allocating) the full document.
+    low = text.lower()
+    sentences = _split_sentences(text)
+    hits = _scan_gates(low)
+
+    doc_type = detect_document_type(text, low)
+    risk_level, risk_reason, risk_score = compute_risk(text, low)
+    # _clean collapsed whitespace to single spaces, so words = spaces + 1 —
+    # counted in C without materializing a list of word strings.
+    word_count = text.count(' ') + 1
 
     return AnalysisResult(
         document_type=doc_type,
-        document_summary=build_summary(doc_type, text),
+        document_summary=build_summary(doc_type, word_count),
         risk_level=risk_level,
         risk_reason=risk_reason,
         risk_score=risk_score,
         readability=compute_readability(text),
-        key_points=[r for r in (d(text) for d in DETECTORS) if r is not None],
-        red_flags=detect_red_flags(text),
-        before_signing=build_checklist(text, doc_type, risk_level),
-        word_count=len(text.split()),
+        key_points=[r for r in (d(text, low, sentences, hits) for d in DETECTORS) if r is not None],
+        red_flags=detect_red_flags(text, low, sentences),
+        before_signing=build_checklist(text, doc_type, risk_level, low),
+        word_count=word_count,
         char_count=len(text),
     )
+
+
+# Re-analysis of the same document is common in the web app (result-page
+# refreshes, repeated API posts), so cache full results keyed by a BLAKE2
+# hash of the text — hashing is O(len) once vs. re-running every pattern.
+_RESULT_CACHE: OrderedDict = OrderedDict()
+_RESULT_CACHE_MAX = 64
+# Guards the get/move_to_end/popitem sequences — the web app serves requests
+# from multiple threads, and an eviction racing a lookup would KeyError.
+_result_cache_lock = threading.Lock()
+
+def analyze_cached(text: str) -> AnalysisResult:
+    """Like analyze(), but memoized per document (LRU, newest 64 kept)."""
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"),
+                          digest_size=16).digest()
+    with _result_cache_lock:
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(key)
+            return cached
+    result = analyze(text)
+    with _result_cache_lock:
+        _RESULT_CACHE[key] = result
+        if len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def analyze_batch(texts: List[str], workers: Optional[int] = None,
+                  chunksize: int = 32) -> List[AnalysisResult]:
+    """
+    Analyze many documents in parallel, one process per core.
+
+    analyze() is pure CPU work and each document is independent, so
+    throughput scales roughly with core count. Every compiled pattern
+    table is built at module import, so worker processes inherit them
+    ready-made instead of rebuilding per task. Batches of one skip the
+    pool — process startup would cost more than the analysis.
+    """
+    texts = list(texts)
+    if len(texts) <= 1:
+        return [analyze(t) for t in texts]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze, texts, chunksize=chunksize))
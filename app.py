@@ -2,111 +2,487 @@ from flask import (
     Flask, render_template, request, redirect, url_for,
     flash, jsonify, send_file, session
 )
-from analyzer import analyze, AnalysisResult
+from analyzer import analyze, analyze_cached, AnalysisResult
 from llm import enhance_with_llm, ollama_status, LLMInsight
-import io, os, uuid
+from collections import OrderedDict
+from secrets import token_urlsafe
+import hashlib, importlib, io, json, os, random, sys, threading, time
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Tesseract 4+ spins up its own OpenMP threads per invocation; inside an
+# already-threaded worker that just thrashes cores. One thread per instance.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 app = Flask(
     __name__,
     template_folder=os.path.join(BASE_DIR, "templates"),
     static_folder=os.path.join(BASE_DIR, "static"),
 )
 app.secret_key = os.environ.get("SECRET_KEY", "tc-analyzer-dev-key")
+# Reject oversized request bodies before any view code runs (413).
+app.config["MAX_CONTENT_LENGTH"] = 20 * 1024 * 1024
+
+# orjson encodes the big result.to_dict() payloads several times faster
+# than the stdlib encoder jsonify uses by default. Optional, like
+# pypdfium2/tesserocr — stdlib json serves when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
 
 # ── In-memory result cache ───────────────────────────────────────────────────
+# Near-LRU via "2-random" sampled eviction: entries carry a last-used
+# timestamp, and on overflow we sample two keys and evict the older one.
+# Hit rate is close to strict LRU at this size, but reads never take the
+# lock (a plain attribute write is atomic in CPython) and writes hold it
+# only long enough to pick a victim — no shared recency list to serialize
+# every lookup through.
+
+class _CacheEntry:
+    __slots__ = ("payload", "ts")
+
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.ts = time.monotonic()
+
 _cache: dict = {}
+_cache_lock = threading.Lock()
 _MAX_CACHE = 50
 
-def _cache_put(result: AnalysisResult, insight: LLMInsight) -> str:
-    key = str(uuid.uuid4())
-    if len(_cache) >= _MAX_CACHE:
-        del _cache[next(iter(_cache))]
-    _cache[key] = {"result": result.to_dict(), "insight": _insight_to_dict(insight)}
+def _cache_store(payload: dict) -> str:
+    # The cache is in-process, so store the live objects — dict round-trips
+    # belong at the JSON boundary, not on every export click. token_urlsafe
+    # gives an unguessable 16-char key with one urandom call — no UUID
+    # object or hyphenated 36-char string to build and ship in every URL.
+    key = token_urlsafe(12)
+    with _cache_lock:
+        if len(_cache) >= _MAX_CACHE:
+            k1, k2 = random.sample(list(_cache), 2)
+            victim = k1 if _cache[k1].ts < _cache[k2].ts else k2
+            del _cache[victim]
+        _cache[key] = _CacheEntry(payload)
     return key
 
-def _cache_get(key: str):
+def _cache_lookup(key: str):
     entry = _cache.get(key)
+    if entry is None:
+        return None
+    entry.ts = time.monotonic()   # lock-free recency bump
+    return entry.payload
+
+def _cache_get(key: str):
+    entry = _cache_lookup(key)
     if not entry:
         return None, None
-    result  = AnalysisResult.from_dict(entry["result"])
-    insight = _insight_from_dict(entry["insight"])
-    return result, insight
+    return entry["result"], entry["insight"]
+
+# Since live objects went into the cache, this dict only exists at the
+# JSON response boundary. The seven keys never change, so intern them once
+# — every response dict shares the same key objects and hashes by pointer.
+_INSIGHT_KEYS = tuple(sys.intern(k) for k in (
+    "plain_summary", "overall_verdict", "negotiation_tips",
+    "plain_red_flags", "user_questions", "model_used", "enhanced",
+))
 
 def _insight_to_dict(i: LLMInsight) -> dict:
-    return {
-        "plain_summary":    i.plain_summary,
-        "overall_verdict":  i.overall_verdict,
-        "negotiation_tips": i.negotiation_tips,
-        "plain_red_flags":  i.plain_red_flags,
-        "user_questions":   i.user_questions,
-        "model_used":       i.model_used,
-        "enhanced":         i.enhanced,
-    }
-
-def _insight_from_dict(d: dict) -> LLMInsight:
-    return LLMInsight(**d)
+    return dict(zip(_INSIGHT_KEYS, (
+        i.plain_summary, i.overall_verdict, i.negotiation_tips,
+        i.plain_red_flags, i.user_questions, i.model_used, i.enhanced,
+    )))
+
+# ── Ollama status probe ──────────────────────────────────────────────────────
+# ollama_status() makes an HTTP round-trip to the local daemon; calling it
+# on every page GET gates the index on Ollama liveness. A 5-second TTL is
+# fresh enough for a status badge and collapses the probe to ~one call per
+# few seconds regardless of traffic.
+_STATUS_TTL = 5.0
+_status_cache = {"ts": 0.0, "val": None}
+_status_lock = threading.Lock()
+
+def _status() -> dict:
+    now = time.monotonic()
+    if now - _status_cache["ts"] > _STATUS_TTL:
+        with _status_lock:
+            if now - _status_cache["ts"] > _STATUS_TTL:   # lost the race?
+                _status_cache["val"] = ollama_status()
+                _status_cache["ts"] = time.monotonic()
+    return _status_cache["val"]
+
+# ── LLM enhancement worker ───────────────────────────────────────────────────
+# Ollama takes seconds per document; running it inline made /analyze block
+# on five generation calls before the user saw anything. Enhancement now
+# runs on this small pool and the result page polls /api/llm/result/<key>
+# until the insight is ready — perceived latency drops to extraction +
+# rule-engine time. Two workers is deliberate: the local Ollama daemon
+# serializes generations anyway, so more would just queue there.
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+_llm_pool = _ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm")
+
+# ── LLM insight cache ────────────────────────────────────────────────────────
+# The rule engine memoizes itself (analyze_cached); LLM output is
+# non-deterministic, but replaying a stored answer for an identical document
+# is fine and skips five Ollama round-trips on re-submits and retries.
+_INSIGHT_CACHE: OrderedDict = OrderedDict()
+_MAX_INSIGHT_CACHE = 128
+# Guards the get/move_to_end/popitem sequences — an eviction racing a lookup
+# from another pool thread would KeyError. Same pattern as _text_cache_lock.
+_insight_cache_lock = threading.Lock()
+
+def _enhance_cached(text: str, result: AnalysisResult,
+                    on_section=None) -> LLMInsight:
+    dt, rl, rs = result.document_type, result.risk_level, result.risk_score
+    key = (hashlib.blake2b(text.encode("utf-8", "surrogatepass"),
+                           digest_size=16).digest(),
+           dt, rl, round(rs, 2))
+    with _insight_cache_lock:
+        cached = _INSIGHT_CACHE.get(key)
+        if cached is not None:
+            _INSIGHT_CACHE.move_to_end(key)
+    if cached is not None:
+        if on_section is not None:   # replay so streaming clients still fill in
+            for name in ("plain_summary", "overall_verdict", "negotiation_tips",
+                         "plain_red_flags", "user_questions"):
+                value = getattr(cached, name)
+                if value:
+                    on_section(name, value)
+        return cached
+    insight = enhance_with_llm(text=text, doc_type=dt,
+                               risk_level=rl, risk_score=rs,
+                               on_section=on_section)
+    if insight.enhanced:   # don't pin "Ollama unavailable" placeholders
+        with _insight_cache_lock:
+            _INSIGHT_CACHE[key] = insight
+            if len(_INSIGHT_CACHE) > _MAX_INSIGHT_CACHE:
+                _INSIGHT_CACHE.popitem(last=False)
+    return insight
 
 # ── File type helpers ────────────────────────────────────────────────────────
-ALLOWED_TEXT  = {".txt"}
-ALLOWED_PDF   = {".pdf"}
-ALLOWED_IMAGE = {".png", ".jpg", ".jpeg", ".webp", ".tiff", ".bmp", ".gif"}
+# Dotless extensions in frozensets: _ext only lowercases the few characters
+# after the last dot instead of the whole (possibly long) filename, and
+# frozenset membership hashes straight to the answer.
+ALLOWED_TEXT  = frozenset({"txt"})
+ALLOWED_PDF   = frozenset({"pdf"})
+ALLOWED_IMAGE = frozenset({"png", "jpg", "jpeg", "webp", "tiff", "bmp", "gif"})
 ALL_ALLOWED   = ALLOWED_TEXT | ALLOWED_PDF | ALLOWED_IMAGE
 
 def _ext(fn: str) -> str:
-    return os.path.splitext(fn.lower())[1]
+    i = fn.rfind(".")
+    return "" if i < 0 else fn[i + 1:].lower()
+
+# ── OCR engine ───────────────────────────────────────────────────────────────
+# tesserocr keeps a live Tesseract API in-process, so each worker thread
+# loads eng.traineddata exactly once and every subsequent image is just a
+# SetImage/GetUTF8Text pair — no subprocess fork, no model reload.
+# pytesseract (the CLI wrapper) stays as the fallback when tesserocr is
+# not installed, mirroring the pypdfium2/PyPDF2 arrangement above.
+try:
+    from tesserocr import OEM, PSM, PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+_tess_local = threading.local()
+_tess_apis: list = []          # every API ever created, for atexit cleanup
+_tess_apis_lock = threading.Lock()
+
+def _tess():
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        # Same engine/segmentation choices as the CLI path: LSTM-only with
+        # "uniform block of text", the shape of a typical contract scan.
+        api = PyTessBaseAPI(lang="eng", oem=OEM.LSTM_ONLY, psm=PSM.SINGLE_BLOCK)
+        _tess_local.api = api
+        with _tess_apis_lock:
+            _tess_apis.append(api)
+    return api
+
+def _tess_shutdown() -> None:
+    for api in _tess_apis:
+        api.End()
+
+# Page-level OCR pool: multi-page PDFs are embarrassingly parallel once
+# model load is amortized, but a shared API handle serializes recognition.
+# Each pool worker borrows its own pre-initialized API from a queue, so N
+# pages recognize on N cores with OMP_THREAD_LIMIT=1 keeping each instance
+# to a single thread. Built lazily on the first scanned PDF.
+_OCR_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+_ocr_executor_obj = None
+_ocr_queue = None
+_ocr_init_lock = threading.Lock()
+
+def _ocr_one(img) -> str:
+    api = _ocr_queue.get()
+    try:
+        api.SetImage(img)
+        return api.GetUTF8Text()
+    finally:
+        _ocr_queue.put(api)
+
+def _ocr_executor():
+    global _ocr_executor_obj, _ocr_queue
+    with _ocr_init_lock:
+        if _ocr_executor_obj is None:
+            from concurrent.futures import ThreadPoolExecutor
+            from queue import Queue
+            _ocr_queue = Queue()
+            for _ in range(_OCR_WORKERS):
+                api = PyTessBaseAPI(lang="eng", oem=OEM.LSTM_ONLY,
+                                    psm=PSM.SINGLE_BLOCK)
+                with _tess_apis_lock:
+                    _tess_apis.append(api)
+                _ocr_queue.put(api)
+            _ocr_executor_obj = ThreadPoolExecutor(
+                max_workers=_OCR_WORKERS, thread_name_prefix="ocr")
+    return _ocr_executor_obj
+
+if PyTessBaseAPI is not None:
+    import atexit
+    atexit.register(_tess_shutdown)
 
 # ── Text extractors ──────────────────────────────────────────────────────────
 
-def _from_txt(raw: bytes) -> str:
-    return raw.decode("utf-8", errors="ignore")
+def _from_txt(stream) -> str:
+    return stream.read().decode("utf-8", errors="ignore")
+
+_WHITESPACE = " \t\n\r\v\f"
 
-def _from_pdf(raw: bytes) -> str:
+def _has_min_content(s: str, n: int = 100) -> bool:
+    """True once `s` holds at least `n` non-whitespace characters.
+
+    `text.strip()` just to test "did extraction find anything" copies the
+    whole multi-MB string first; this scans in slices with C-level count()
+    and bails as soon as the threshold is met — usually within the first
+    slice.
+    """
+    need = n
+    for i in range(0, len(s), 4096):
+        chunk = s[i:i + 4096]
+        need -= len(chunk) - sum(chunk.count(c) for c in _WHITESPACE)
+        if need <= 0:
+            return True
+    return False
+
+def _from_pdf(stream) -> str:
     try:
-        import PyPDF2
-        reader = PyPDF2.PdfReader(io.BytesIO(raw))
-        text = "\n".join(p.extract_text() or "" for p in reader.pages)
-        return text if len(text.strip()) >= 100 else _pdf_ocr_fallback(raw)
+        text = _pdf_text(stream)
+        if _has_min_content(text):
+            return text
+        # The parser consumed the stream; rewind and hand the raw bytes to
+        # the rasterizer — only the OCR path ever needs the full copy.
+        stream.seek(0)
+        return _pdf_ocr_fallback(stream.read())
     except ImportError:
-        flash("PyPDF2 not installed.", "warning"); return ""
+        flash("No PDF library installed (pypdfium2 or PyPDF2).", "warning"); return ""
     except Exception as e:
         flash(f"PDF error: {e}", "danger"); return ""
 
+def _pdf_text(stream) -> str:
+    # pypdfium2 wraps PDFium (C++) — several times faster than PyPDF2's
+    # pure-Python extractor on long policies, with better text ordering.
+    # PyPDF2 stays as the fallback when pypdfium2 isn't installed.
+    # Both readers take file-like objects, so the upload's spooled temp
+    # file goes in directly — no intermediate bytes copy.
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        import PyPDF2
+        reader = PyPDF2.PdfReader(stream)
+        return "\n".join(p.extract_text() or "" for p in reader.pages)
+    doc = pdfium.PdfDocument(stream)
+    try:
+        parts = []
+        for page in doc:
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            # Release PDFium's per-page buffers as we go instead of letting
+            # a 500-page policy hold every page live until doc.close().
+            textpage.close()
+            page.close()
+        return "\n".join(parts)
+    finally:
+        doc.close()
+
 def _pdf_ocr_fallback(raw: bytes) -> str:
     try:
+        import tempfile
         from pdf2image import convert_from_bytes
         import pytesseract
-        return "\n".join(pytesseract.image_to_string(p) for p in convert_from_bytes(raw, dpi=200))
+        # 150 dpi is plenty for printed contract text and cuts per-page
+        # render + OCR time substantially vs 200 dpi. Grayscale drops the
+        # raster to a third of the bytes — tesseract binarizes internally
+        # anyway — and poppler renders pages on all cores.
+        pages = convert_from_bytes(raw, dpi=150, grayscale=True,
+                                   thread_count=os.cpu_count() or 1)
+        if not pages:
+            return ""
+        if PyTessBaseAPI is not None:
+            # Fan pages out across the OCR pool — each worker owns a live
+            # API, so per-page cost is image hand-off plus recognition and
+            # pages run concurrently; map preserves page order.
+            return "\n".join(_ocr_executor().map(_ocr_one, pages))
+        # One tesseract invocation for the whole document: handing the
+        # binary a list file makes it load its language model once, instead
+        # of paying startup + model load per page as image_to_string(page)
+        # in a loop would.
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i, img in enumerate(pages):
+                path = os.path.join(tmp, f"page_{i:03d}.png")
+                # cheapest PNG settings — these files live for milliseconds
+                img.save(path, "PNG", optimize=False, compress_level=1)
+                paths.append(path)
+            listing = os.path.join(tmp, "images.txt")
+            with open(listing, "w") as fh:
+                fh.write("\n".join(paths))
+            return pytesseract.image_to_string(listing, config="--oem 1 --psm 6")
     except Exception as e:
         flash(f"PDF OCR failed: {e}", "warning"); return ""
 
-def _from_image(raw: bytes) -> str:
+def _from_image(stream) -> str:
     try:
         import pytesseract
+        # Pillow-SIMD is a drop-in replacement for Pillow (same import path)
+        # whose AVX2 builds speed up decode and convert() considerably —
+        # worth installing where the CPU supports it.
         from PIL import Image
-        img = Image.open(io.BytesIO(raw))
-        if img.mode not in ("RGB", "L"):
-            img = img.convert("RGB")
-        text = pytesseract.image_to_string(img)
+        img = Image.open(stream)
+        # 8-bit grayscale is all OCR needs — tesseract binarizes internally,
+        # and an RGB buffer triples the bytes handed across per image. Only
+        # bilevel scans are already smaller than L.
+        if img.mode not in ("L", "1"):
+            img = img.convert("L")
+        if PyTessBaseAPI is not None:
+            api = _tess()
+            api.SetImage(img)
+            text = api.GetUTF8Text()
+        else:
+            # LSTM-only engine with "uniform block of text" segmentation —
+            # the typical T&C scan — is noticeably faster than the default.
+            text = pytesseract.image_to_string(img, config="--oem 1 --psm 6")
         if not text.strip():
             flash("No text extracted from image — check that it is clear and legible.", "warning")
         return text
     except Exception as e:
         flash(f"Image OCR failed: {e}", "danger"); return ""
 
-def _extract_text(filename: str, raw: bytes) -> str:
+_MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+# Tighter cap for the JSON/raw-text API: 10 MB of text is far beyond any
+# real contract, and the raw branch decodes the whole body as UTF-8.
+MAX_BODY = 10 * 1024 * 1024
+
+def _checked_stream(upload):
+    """Return the upload's stream with a hard byte cap, or None if oversize.
+
+    MAX_CONTENT_LENGTH already bounds the whole body; this guards the
+    individual file even if that config is raised or bypassed by a proxy.
+    Size is checked by seeking Werkzeug's spooled temp file — the bytes
+    are never pulled into a Python string here; the parsers read the
+    file-like object directly.
+    """
+    stream = upload.stream
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    if size > _MAX_UPLOAD_BYTES:
+        flash("File too large — uploads are capped at 20 MB.", "danger")
+        return None
+    return stream
+
+# Extracted-text memo, content-addressed: the same file re-uploaded (users
+# retry with the LLM toggle flipped all the time) skips parsing and OCR
+# entirely. Hashing the spool in chunks costs milliseconds; the PDF parse
+# or OCR pass it avoids costs hundreds.
+_text_cache: OrderedDict = OrderedDict()
+_text_cache_lock = threading.Lock()
+_MAX_TEXT_CACHE = 32
+
+def _stream_digest(stream) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    while True:
+        chunk = stream.read(1 << 20)
+        if not chunk:
+            break
+        h.update(chunk)
+    stream.seek(0)
+    return h.digest()
+
+def _extract_text(filename: str, stream) -> str:
+    if stream is None:
+        return ""
     ext = _ext(filename)
-    if ext in ALLOWED_TEXT:  return _from_txt(raw)
-    if ext in ALLOWED_PDF:   return _from_pdf(raw)
-    if ext in ALLOWED_IMAGE: return _from_image(raw)
-    flash(f"Unsupported file type: {ext}", "danger"); return ""
+    if ext not in ALL_ALLOWED:
+        flash(f"Unsupported file type: .{ext}", "danger"); return ""
+    key = (_stream_digest(stream), ext)
+    with _text_cache_lock:
+        cached = _text_cache.get(key)
+        if cached is not None:
+            _text_cache.move_to_end(key)
+            return cached
+    if ext in ALLOWED_TEXT:  text = _from_txt(stream)
+    elif ext in ALLOWED_PDF: text = _from_pdf(stream)
+    else:                    text = _from_image(stream)
+    if text:   # failures flash their own message — don't memoize those
+        with _text_cache_lock:
+            _text_cache[key] = text
+            if len(_text_cache) > _MAX_TEXT_CACHE:
+                _text_cache.popitem(last=False)
+    return text
+
+def _analyze_many(entries: list) -> tuple:
+    """Analyze [(key, name, text), ...] across cores.
+
+    Returns ({key: (name, result)}, errors). Documents run through
+    analyzer.analyze_batch so the compare endpoints scale with core count;
+    if the batch fails, fall back to sequential analysis so errors can be
+    attributed to the right document.
+    """
+    from analyzer import analyze_batch
+    results, errors = {}, []
+    try:
+        for (key, name, _), r in zip(entries,
+                                     analyze_batch([t for _, _, t in entries])):
+            results[key] = (name, r)
+    except Exception:
+        results.clear()
+        for key, name, text in entries:
+            try:
+                results[key] = (name, analyze(text))
+            except Exception as e:
+                errors.append(f"{name}: analysis failed — {e}")
+    return results, errors
+
+# ── Module warm-up ───────────────────────────────────────────────────────────
+# The export and compare routes import reportlab / python-docx lazily, so the
+# first user to click an export used to eat a 500-1500 ms cold import. Pull
+# those modules in on a background thread at startup; the per-route imports
+# stay as the fallback and become dict lookups once this finishes.
+
+def _warmup() -> None:
+    for mod in ("exporters", "comparator", "multi_compare", "llm"):
+        try:
+            importlib.import_module(mod)
+        except Exception:
+            pass   # optional module missing/broken — its route reports the error
+
+threading.Thread(target=_warmup, name="module-warmup", daemon=True).start()
 
 # ── Web routes ───────────────────────────────────────────────────────────────
 
 @app.route("/", methods=["GET"])
 def index():
-    llm_info = ollama_status()
+    llm_info = _status()
     return render_template("index.html", llm=llm_info)
 
 
@@ -118,48 +494,49 @@ def analyze_doc():
     if upload and upload.filename:
         ext = _ext(upload.filename)
         if ext not in ALL_ALLOWED:
-            flash(f"Unsupported file type '{ext}'.", "danger")
+            flash(f"Unsupported file type '.{ext}'.", "danger")
             return redirect(url_for("index"))
-        text = _extract_text(upload.filename, upload.read())
+        text = _extract_text(upload.filename, _checked_stream(upload))
         source_label = upload.filename
     else:
         text = request.form.get("text", "").strip()
         source_label = "Pasted text"
 
-    if not text or not text.strip():
+    # One strip pass covers both validations and what the analyzer sees —
+    # no point whitespace-scanning a large extraction three times.
+    text = text.strip() if text else ""
+    if not text:
         flash("No text found. Please paste text or upload a readable file.", "danger")
         return redirect(url_for("index"))
-    if len(text.strip()) < 50:
+    if len(text) < 50:
         flash("Document is too short to analyze.", "warning")
         return redirect(url_for("index"))
 
     try:
-        result = analyze(text)
+        result = analyze_cached(text)
     except Exception as e:
         flash(f"Analysis error: {e}", "danger")
         return redirect(url_for("index"))
 
-    # ── LLM enhancement (non-blocking — falls back gracefully) ──────────────
+    # ── LLM enhancement (truly non-blocking: queued, page streams it) ───────
+    # The worker appends each finished section to this list (list.append is
+    # atomic), and /api/llm/stream pushes them to the page as SSE events.
     use_llm = request.form.get("use_llm", "on") != "off"
     insight = LLMInsight()
-    if use_llm:
-        try:
-            insight = enhance_with_llm(
-                text=text,
-                doc_type=result.document_type,
-                risk_level=result.risk_level,
-                risk_score=result.risk_score,
-            )
-        except Exception as e:
-            app.logger.warning("LLM enhancement failed: %s", e)
+    sections: list = []
+    future = (_llm_pool.submit(_enhance_cached, text, result,
+                               lambda name, value: sections.append((name, value)))
+              if use_llm else None)
 
-    cache_key = _cache_put(result, insight)
+    cache_key = _cache_store({"result": result, "insight": insight,
+                              "llm_future": future, "llm_sections": sections})
     session["result_key"] = cache_key
 
     return render_template(
         "result.html",
         r=result,
         llm=insight,
+        llm_pending=use_llm,
         source=source_label,
         cache_key=cache_key,
     )
@@ -169,56 +546,102 @@ def analyze_doc():
 
 def _get_cached() -> tuple:
     key = request.args.get("key") or session.get("result_key")
-    return _cache_get(key) if key else (None, None)
+    if not key:
+        return None, None, None
+    result, insight = _cache_get(key)
+    return key, result, insight
+
+
+# Rendered-export memo: users typically click PDF, then summary, then Word
+# on the same result, and reportlab/python-docx serialization is the whole
+# cost of those routes. Key on (cache key, format) — keys are unique per
+# analysis, so entries never go stale. Same 2-random eviction as the
+# result cache, with the last-used timestamp kept inline.
+_export_cache: dict = {}
+_export_cache_lock = threading.Lock()
+_MAX_EXPORT_CACHE = 64
+
+def _render_export(key: str, fmt: str, gen, result) -> bytes:
+    k = (key, fmt)
+    entry = _export_cache.get(k)
+    if entry is not None:
+        entry[0] = time.monotonic()
+        return entry[1]
+    body = gen(result)
+    with _export_cache_lock:
+        if len(_export_cache) >= _MAX_EXPORT_CACHE:
+            k1, k2 = random.sample(list(_export_cache), 2)
+            victim = k1 if _export_cache[k1][0] < _export_cache[k2][0] else k2
+            del _export_cache[victim]
+        _export_cache[k] = [time.monotonic(), body]
+    return body
+
+
+def _download(data: bytes, mimetype: str, filename: str, etag: str = None):
+    """Send generated bytes as an attachment without an extra BytesIO copy.
+
+    reportlab and python-docx both materialize the whole file before
+    returning, so there is nothing to stream chunk-by-chunk — but wrapping
+    the result in BytesIO for send_file duplicated every export in memory.
+    Cache keys are immutable (unique per analysis), so an ETag derived from
+    the key lets a repeat download of the same report come back as a
+    bodyless 304 instead of re-sending the file.
+    """
+    resp = app.response_class(data, mimetype=mimetype)
+    resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if etag:
+        resp.set_etag(etag)
+        return resp.make_conditional(request)
+    return resp
 
 
 @app.route("/export/pdf")
 def export_pdf():
-    result, insight = _get_cached()
+    key, result, insight = _get_cached()
     if not result:
         flash("No analysis found — please analyze a document first.", "warning")
         return redirect(url_for("index"))
     from exporters import export_pdf as gen
-    return send_file(io.BytesIO(gen(result)),
-        mimetype="application/pdf", as_attachment=True,
-        download_name="tc_analysis_report.pdf")
+    return _download(_render_export(key, "pdf", gen, result),
+                     "application/pdf", "tc_analysis_report.pdf",
+                     etag=f"{key}-pdf")
 
 @app.route("/export/summary")
 def export_summary():
-    result, insight = _get_cached()
+    key, result, insight = _get_cached()
     if not result:
         flash("No analysis found.", "warning"); return redirect(url_for("index"))
     from exporters import export_summary_pdf as gen
-    return send_file(io.BytesIO(gen(result)),
-        mimetype="application/pdf", as_attachment=True,
-        download_name="tc_summary.pdf")
+    return _download(_render_export(key, "summary", gen, result),
+                     "application/pdf", "tc_summary.pdf",
+                     etag=f"{key}-summary")
 
 @app.route("/export/word")
 def export_word():
-    result, insight = _get_cached()
+    key, result, insight = _get_cached()
     if not result:
         flash("No analysis found.", "warning"); return redirect(url_for("index"))
     from exporters import export_word as gen
-    return send_file(io.BytesIO(gen(result)),
-        mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        as_attachment=True, download_name="tc_analysis_report.docx")
+    return _download(_render_export(key, "word", gen, result),
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "tc_analysis_report.docx", etag=f"{key}-word")
 
 @app.route("/export/csv")
 def export_csv():
-    result, insight = _get_cached()
+    key, result, insight = _get_cached()
     if not result:
         flash("No analysis found.", "warning"); return redirect(url_for("index"))
     from exporters import export_csv as gen
-    return send_file(io.BytesIO(gen(result)),
-        mimetype="text/csv", as_attachment=True,
-        download_name="tc_analysis.csv")
+    return _download(_render_export(key, "csv", gen, result),
+                     "text/csv", "tc_analysis.csv",
+                     etag=f"{key}-csv")
 
 
 # ── REST API ─────────────────────────────────────────────────────────────────
 
 @app.route("/api/health", methods=["GET"])
 def api_health():
-    llm = ollama_status()
+    llm = _status()
     return jsonify({"status": "ok", "version": "3.0", "llm": llm})
 
 
@@ -231,6 +654,12 @@ def api_analyze():
       • application/json    → { "text": "...", "use_llm": true }
       • multipart/form-data → file field or text field
     """
+    # Bound worst-case memory before touching the body: the raw-text branch
+    # below would otherwise load and UTF-8-decode an arbitrary payload.
+    # (MAX_CONTENT_LENGTH still caps the whole request at the upload limit.)
+    if request.content_length and request.content_length > MAX_BODY:
+        return jsonify({"error": "Payload too large (10 MB limit)."}), 413
+
     text, use_llm = "", True
     ct = request.content_type or ""
 
@@ -245,21 +674,24 @@ def api_analyze():
         if upload and upload.filename:
             ext = _ext(upload.filename)
             if ext not in ALL_ALLOWED:
-                return jsonify({"error": f"Unsupported file type: {ext}"}), 415
-            text = _extract_text(upload.filename, upload.read())
+                return jsonify({"error": f"Unsupported file type: .{ext}"}), 415
+            text = _extract_text(upload.filename, _checked_stream(upload))
         else:
-            text = request.form.get("text", "").strip()
+            text = request.form.get("text", "")
         use_llm = request.form.get("use_llm", "true").lower() != "false"
     else:
-        text = request.get_data(as_text=True).strip()
+        text = request.get_data(as_text=True)
 
+    # Single strip pass for every input branch (the JSON one already
+    # stripped to validate its own 400) — the analyzer sees the same copy.
+    text = text.strip() if text else ""
     if not text:
         return jsonify({"error": "No text provided."}), 400
     if len(text) < 50:
         return jsonify({"error": "Text too short (minimum 50 characters)."}), 400
 
     try:
-        result = analyze(text)
+        result = analyze_cached(text)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -267,12 +699,7 @@ def api_analyze():
 
     if use_llm:
         try:
-            insight = enhance_with_llm(
-                text=text,
-                doc_type=result.document_type,
-                risk_level=result.risk_level,
-                risk_score=result.risk_score,
-            )
+            insight = _enhance_cached(text, result)
             response_data["llm_insight"] = _insight_to_dict(insight)
         except Exception as e:
             response_data["llm_insight"] = {"enhanced": False, "error": str(e)}
@@ -282,12 +709,81 @@ def api_analyze():
 
 @app.route("/api/llm/status", methods=["GET"])
 def api_llm_status():
-    return jsonify(ollama_status())
+    return jsonify(_status())
+
+
+@app.route("/api/llm/result/<key>", methods=["GET"])
+def api_llm_result(key):
+    """Poll for a background LLM enhancement.
+
+    The result page renders immediately after rule analysis and calls this
+    until ready; the completed insight is folded back into the cache entry
+    so later reads (and the API path) see it without re-running Ollama.
+    """
+    entry = _cache_lookup(key)
+    if entry is None or "result" not in entry:
+        return jsonify({"error": "Unknown or expired result key."}), 404
+    future = entry.get("llm_future")
+    if future is not None:
+        if not future.done():
+            return jsonify({"ready": False, "insight": None})
+        try:
+            entry["insight"] = future.result()
+        except Exception as e:
+            app.logger.warning("LLM enhancement failed: %s", e)
+        entry["llm_future"] = None
+    return jsonify({"ready": True, "insight": _insight_to_dict(entry["insight"])})
+
+
+@app.route("/api/llm/stream/<key>", methods=["GET"])
+def api_llm_stream(key):
+    """Stream a background LLM enhancement as server-sent events.
+
+    One `data:` event per section the moment its prompt finishes, so the
+    page shows the verdict in ~1s while the longer lists still generate —
+    perceived latency is the fastest prompt, not the whole batch. Closes
+    with a {"done": true, "insight": ...} event; the polling route above
+    stays as the fallback for clients without EventSource.
+    """
+    entry = _cache_lookup(key)
+    if entry is None or "result" not in entry:
+        return jsonify({"error": "Unknown or expired result key."}), 404
+
+    def events():
+        future = entry.get("llm_future")
+        # Bind the live list itself (it is usually still empty here) — an
+        # `or ()` default would freeze an empty snapshot forever.
+        sections = entry.get("llm_sections", ())
+        sent = 0
+        done = False
+        while not done:
+            # Read done *before* draining — a section appended after the
+            # drain but before the check is picked up next iteration.
+            done = future is None or future.done()
+            while sent < len(sections):
+                name, value = sections[sent]
+                sent += 1
+                yield f"data: {json.dumps({'section': name, 'value': value})}\n\n"
+            if not done:
+                time.sleep(0.25)
+        if future is not None:
+            try:
+                entry["insight"] = future.result()
+            except Exception as e:
+                app.logger.warning("LLM enhancement failed: %s", e)
+            entry["llm_future"] = None
+        yield "data: " + json.dumps(
+            {"done": True, "insight": _insight_to_dict(entry["insight"])}) + "\n\n"
+
+    resp = app.response_class(events(), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"   # don't let nginx buffer the stream
+    return resp
 
 
 @app.route("/api/docs")
 def api_docs():
-    llm = ollama_status()
+    llm = _status()
     return render_template("api.html", llm=llm)
 
 
@@ -300,7 +796,7 @@ def about():
 
 @app.route("/compare", methods=["GET"])
 def compare_index():
-    llm_info = ollama_status()
+    llm_info = _status()
     return render_template("compare.html", llm=llm_info)
 
 
@@ -309,8 +805,8 @@ def compare_analyze():
     from comparator import compare as run_compare
     from llm import compare_with_llm
 
-    errors = []
-    results = {}
+    errors  = []
+    pending = []   # (side, name, text) — analyzed together once both validate
 
     for side in ("left", "right"):
         name = request.form.get(f"{side}_name", "").strip() or ("Document A" if side == "left" else "Document B")
@@ -320,19 +816,21 @@ def compare_analyze():
         if upload and upload.filename:
             ext = _ext(upload.filename)
             if ext not in ALL_ALLOWED:
-                errors.append(f"{name}: unsupported file type '{ext}'.")
+                errors.append(f"{name}: unsupported file type '.{ext}'.")
             else:
-                text = _extract_text(upload.filename, upload.read())
+                text = _extract_text(upload.filename, _checked_stream(upload))
         else:
             text = request.form.get(f"{side}_text", "").strip()
 
         if not text or len(text.strip()) < 50:
             errors.append(f"{name}: please provide at least 50 characters of text.")
         else:
-            try:
-                results[side] = (name, analyze(text))
-            except Exception as e:
-                errors.append(f"{name}: analysis failed — {e}")
+            pending.append((side, name, text))
+
+    results = {}
+    if not errors:
+        results, batch_errors = _analyze_many(pending)
+        errors.extend(batch_errors)
 
     if errors:
         for err in errors:
@@ -366,10 +864,7 @@ def compare_analyze():
         except Exception as e:
             app.logger.warning("LLM compare failed: %s", e)
 
-    key = str(uuid.uuid4())
-    if len(_cache) >= _MAX_CACHE:
-        del _cache[next(iter(_cache))]
-    _cache[key] = {"compare": comp.to_dict()}
+    key = _cache_store({"compare": comp})
     session["compare_key"] = key
 
     return redirect(url_for("compare_result", key=key))
@@ -377,24 +872,20 @@ def compare_analyze():
 
 @app.route("/compare/result/<key>")
 def compare_result(key):
-    entry = _cache.get(key)
+    entry = _cache_lookup(key)
     if not entry or "compare" not in entry:
         flash("Comparison not found — please run a new comparison.", "warning")
         return redirect(url_for("compare_index"))
-    from comparator import ComparisonResult
-    comp = ComparisonResult.from_dict(entry["compare"])
-    return render_template("compare_result.html", comp=comp, key=key)
+    return render_template("compare_result.html", comp=entry["compare"], key=key)
 
 
 @app.route("/compare/share/<key>")
 def compare_share(key):
     """Minimal shareable card — great for screenshots and links."""
-    entry = _cache.get(key)
+    entry = _cache_lookup(key)
     if not entry or "compare" not in entry:
         return "Comparison not found or expired.", 404
-    from comparator import ComparisonResult
-    comp = ComparisonResult.from_dict(entry["compare"])
-    return render_template("compare_share.html", comp=comp, key=key)
+    return render_template("compare_share.html", comp=entry["compare"], key=key)
 
 
 @app.route("/api/compare", methods=["POST"])
@@ -432,7 +923,7 @@ def api_compare():
 
 @app.route("/multi-compare", methods=["GET"])
 def multi_compare_index():
-    llm_info = ollama_status()
+    llm_info = _status()
     return render_template("multi_compare.html", llm=llm_info)
 
 
@@ -441,8 +932,8 @@ def multi_compare_analyze():
     from multi_compare import multi_compare as run_multi
     from llm import multi_compare_llm
 
-    doc_pairs = []
-    errors    = []
+    pending = []   # (slot index, name, text)
+    errors  = []
 
     # Collect up to 8 documents
     i = 0
@@ -454,11 +945,11 @@ def multi_compare_analyze():
         if upload and upload.filename:
             ext = _ext(upload.filename)
             if ext not in ALL_ALLOWED:
-                errors.append(f"{name}: unsupported file type '{ext}'.")
+                errors.append(f"{name}: unsupported file type '.{ext}'.")
                 i += 1
                 if i >= 8: break
                 continue
-            text = _extract_text(upload.filename, upload.read())
+            text = _extract_text(upload.filename, _checked_stream(upload))
         else:
             text = request.form.get(f"doc_{i}_text", "").strip()
 
@@ -471,11 +962,7 @@ def multi_compare_analyze():
             continue
 
         if text and len(text.strip()) >= 50:
-            try:
-                result = analyze(text)
-                doc_pairs.append((name, result))
-            except Exception as e:
-                errors.append(f"{name}: analysis failed — {e}")
+            pending.append((i, name, text))
         elif text:
             errors.append(f"{name}: too short (minimum 50 characters).")
 
@@ -483,6 +970,12 @@ def multi_compare_analyze():
         if i >= 8:
             break
 
+    # Analyze all collected documents together — up to 8 CPU-bound runs
+    # execute in parallel instead of back to back.
+    results, batch_errors = _analyze_many(pending)
+    errors.extend(batch_errors)
+    doc_pairs = [results[k] for k, _n, _t in pending if k in results]
+
     if len(doc_pairs) < 2:
         flash("Please provide at least 2 documents to compare.", "danger")
         for err in errors:
@@ -510,10 +1003,7 @@ def multi_compare_analyze():
         except Exception as e:
             app.logger.warning("LLM multi-compare failed: %s", e)
 
-    key = str(uuid.uuid4())
-    if len(_cache) >= _MAX_CACHE:
-        del _cache[next(iter(_cache))]
-    _cache[key] = {"multi": comp.to_dict()}
+    key = _cache_store({"multi": comp})
     session["multi_key"] = key
 
     return redirect(url_for("multi_compare_result", key=key))
@@ -521,23 +1011,19 @@ def multi_compare_analyze():
 
 @app.route("/multi-compare/result/<key>")
 def multi_compare_result(key):
-    entry = _cache.get(key)
+    entry = _cache_lookup(key)
     if not entry or "multi" not in entry:
         flash("Comparison not found — please run a new comparison.", "warning")
         return redirect(url_for("multi_compare_index"))
-    from multi_compare import MultiCompareResult
-    comp = MultiCompareResult.from_dict(entry["multi"])
-    return render_template("multi_compare_result.html", comp=comp, key=key)
+    return render_template("multi_compare_result.html", comp=entry["multi"], key=key)
 
 
 @app.route("/multi-compare/share/<key>")
 def multi_compare_share(key):
-    entry = _cache.get(key)
+    entry = _cache_lookup(key)
     if not entry or "multi" not in entry:
         return "Comparison not found or expired.", 404
-    from multi_compare import MultiCompareResult
-    comp = MultiCompareResult.from_dict(entry["multi"])
-    return render_template("multi_compare_share.html", comp=comp, key=key)
+    return render_template("multi_compare_share.html", comp=entry["multi"], key=key)
 
 
 @app.route("/api/multi-compare", methods=["POST"])
@@ -573,4 +1059,7 @@ def api_multi_compare():
 
 
 if __name__ == "__main__":
-    app.run(debug=True, port=5050)
+    # Werkzeug dev server — local development only. Production runs gunicorn
+    # against wsgi:application (see Dockerfile); never ship debug=True there.
+    debug = os.environ.get("FLASK_ENV", "development") == "development"
+    app.run(debug=debug, port=5050)
@@ -5,11 +5,37 @@ from an AnalysisResult without any external API or AI.
 
 import io
 import csv
+import hashlib
+import json
+import threading
+from dataclasses import asdict
 from datetime import datetime
-from typing import Optional
-
+from functools import lru_cache
+from types import SimpleNamespace
+from xml.sax.saxutils import escape as _esc
+from typing import BinaryIO, Optional
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import (
+    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+    HRFlowable
+)
 from analyzer import AnalysisResult
 
+# ReportLab routes stringWidth/escapePDF/base85 through the _rl_accel C
+# extension when the rl_accel package is installed (it's in requirements);
+# the pure-Python fallbacks are ~35% slower on long reports. Warn rather
+# than fail so a wheel-less dev box still exports — just slowly.
+try:
+    import _rl_accel  # noqa: F401  (activates reportlab.lib.rl_accel C paths)
+except ImportError:
+    import warnings
+    warnings.warn("rl_accel C extension not found — PDF export will use "
+                  "ReportLab's slower pure-Python code paths", RuntimeWarning)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Shared helpers
@@ -30,190 +56,343 @@ LGREY   = (220, 220, 220)
 def _now() -> str:
     return datetime.now().strftime("%B %d, %Y at %H:%M")
 
+_RISK_ICON = {"Low": "✓", "Medium": "!", "High": "✕"}
+
 def _risk_icon(level: str) -> str:
-    return {"Low": "✓", "Medium": "!", "High": "✕"}.get(level, "?")
+    return _RISK_ICON.get(level, "?")
+
+# Static markup fragments — ReportLab re-parses Paragraph text on every
+# build, so untrusted result fields must go through _esc() before being
+# interpolated (a stray & or < would otherwise break the paraparser).
+WATCH_HTML = '  <font color="#f4c842" size="7">⚠ WATCH OUT</font>'
+CAT_FMT    = "<font color='#888' size='7'>{}</font>"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Full PDF report  (ReportLab)
+# Rendered-output cache
+#
+# AnalysisResult → bytes is a pure function (bar the timestamp line), and
+# users routinely re-download the same report in several formats. Keyed on
+# a digest of the result's fields rather than object identity so repeat
+# analyses of identical documents hit too. AnalysisResult isn't hashable,
+# so this is a digest-keyed dict instead of functools.lru_cache.
 # ─────────────────────────────────────────────────────────────────────────────
 
-def export_pdf(result: AnalysisResult) -> bytes:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import mm
-    from reportlab.lib import colors
-    from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-        HRFlowable, KeepTogether
-    )
+_RENDER_CACHE: dict = {}   # (digest, kind) -> bytes
+_RENDER_CACHE_MAX = 32
+# Guards the evict/insert pair — two download threads evicting at once would
+# KeyError on the same oldest key. Same pattern as the app/analyzer caches.
+_render_cache_lock = threading.Lock()
 
-    buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buf, pagesize=A4,
-        leftMargin=20*mm, rightMargin=20*mm,
-        topMargin=18*mm, bottomMargin=18*mm,
-        title="T&C Analysis Report"
-    )
+def _result_key(result: AnalysisResult) -> bytes:
+    payload = json.dumps(asdict(result), sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
 
-    W, H = A4
-    cw = W - 40*mm  # content width
+def _render_cached(kind: str, result: AnalysisResult, build) -> bytes:
+    key = (_result_key(result), kind)
+    hit = _RENDER_CACHE.get(key)
+    if hit is None:
+        hit = build(result)   # render outside the lock — it can take a while
+        with _render_cache_lock:
+            if len(_RENDER_CACHE) >= _RENDER_CACHE_MAX:
+                _RENDER_CACHE.pop(next(iter(_RENDER_CACHE)))
+            _RENDER_CACHE[key] = hit
+    return hit
 
-    # ── Colour helpers ──────────────────────────────────────────────────────
-    def rgb(t):  return colors.Color(*[v/255 for v in t])
 
-    rc  = rgb(RISK_COLOR.get(result.risk_level, GREY))
-    gold_c = rgb(GOLD)
-    dark_c = rgb(DARK)
-    grey_c = rgb(GREY)
-    lgrey_c = rgb(LGREY)
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared styles — built once
+#
+# ParagraphStyles are value objects that never change per result, but both
+# PDF exporters used to rebuild every one of them (plus a stylesheet) on
+# each call. They all live here now; the only per-result variation is the
+# risk colour, and there are exactly three risk levels, so those styles
+# are prebuilt per level with a grey fallback for unknown values.
+# ─────────────────────────────────────────────────────────────────────────────
 
-    # ── Styles ──────────────────────────────────────────────────────────────
-    base = getSampleStyleSheet()
+@lru_cache(maxsize=64)
+def _rgb(t: tuple) -> colors.Color:
+    return colors.Color(t[0]/255, t[1]/255, t[2]/255)
+
+GOLD_C  = _rgb(GOLD)
+DARK_C  = _rgb(DARK)
+GREY_C  = _rgb(GREY)
+LGREY_C = _rgb(LGREY)
+
+_RISK_C = {lvl: _rgb(c) for lvl, c in RISK_COLOR.items()}
+
+# 15% tint used behind the risk banner — three possible values, so built here
+_RISK_BG = {lvl: _rgb(tuple(int(v * 0.15) for v in c)) for lvl, c in RISK_COLOR.items()}
+_RISK_BG_DEFAULT = _rgb(tuple(int(v * 0.15) for v in GREY))
+
+def _risk_c(level: str):
+    return _RISK_C.get(level, GREY_C)
+
+_BASE = getSampleStyleSheet()
+
+def _sty(name, parent="Normal", **kw):
+    return ParagraphStyle(name, parent=_BASE[parent], **kw)
+
+# Full-report styles (parented on the sample "Normal")
+_S = {
+    "title": _sty("title", fontSize=22, leading=28, textColor=DARK_C, spaceAfter=4, fontName="Helvetica-Bold"),
+    "sub":   _sty("sub",   fontSize=11, leading=16, textColor=GREY_C, spaceAfter=12),
+    "h2":    _sty("h2",    fontSize=13, leading=18, textColor=DARK_C, spaceBefore=14, spaceAfter=6, fontName="Helvetica-Bold"),
+    "body":  _sty("body",  fontSize=9,  leading=14, textColor=DARK_C, spaceAfter=4),
+    "small": _sty("small", fontSize=8,  leading=12, textColor=GREY_C, spaceAfter=2),
+    "badge": _sty("badge", fontSize=8,  leading=12, textColor=GREY_C),
+    "ev":    _sty("ev",    fontSize=8,  leading=12, textColor=GREY_C, leftIndent=12, spaceAfter=3),
+    "rr":    _sty("rr",    fontSize=9,  leading=13, textColor=DARK_C),
+    "ico":   _sty("ico",   fontSize=16, leading=20),
+    "kt":    _sty("kt",    fontSize=9,  leading=13, fontName="Helvetica-Bold"),
+    "cn":    _sty("cn",    fontSize=9,  textColor=GOLD_C, fontName="Helvetica-Bold", alignment=1),
+    "fi":    _sty("fi",    fontSize=10, leading=14),
+    "foot":  _sty("foot",  fontSize=7,  leading=10, textColor=GREY_C, spaceAfter=0),
+}
 
-    def sty(name, parent="Normal", **kw):
-        s = ParagraphStyle(name, parent=base[parent], **kw)
-        return s
+_S_RK = {lvl: _sty("rk", fontSize=14, textColor=c, fontName="Helvetica-Bold")
+         for lvl, c in _RISK_C.items()}
+_S_RK[None] = _sty("rk", fontSize=14, textColor=GREY_C, fontName="Helvetica-Bold")
+_S_RS = {lvl: _sty("rs", fontSize=14, textColor=c, fontName="Helvetica-Bold", alignment=2)
+         for lvl, c in _RISK_C.items()}
+_S_RS[None] = _sty("rs", fontSize=14, textColor=GREY_C, fontName="Helvetica-Bold", alignment=2)
+
+# Summary-page styles (bare ParagraphStyle, as the one-pager always used)
+def _psty(**kw):
+    return ParagraphStyle("s", **kw)
+
+_SUM = {
+    "title":       _psty(fontSize=18, leading=24, fontName="Helvetica-Bold", spaceAfter=2),
+    "meta":        _psty(fontSize=8,  leading=12, spaceAfter=8),
+    "body":        _psty(fontSize=9,  leading=14, spaceAfter=10),
+    "risk_reason": _psty(fontSize=8,  leading=13, spaceAfter=0),
+    "section":     _psty(fontSize=11, fontName="Helvetica-Bold", spaceAfter=6),
+    "kp_icon":     _psty(fontSize=11, leading=14),
+    "kp_title":    _psty(fontSize=8,  leading=12, fontName="Helvetica-Bold"),
+    "kp_detail":   _psty(fontSize=8,  leading=12),
+    "flag":        _psty(fontSize=8,  leading=13, spaceAfter=3),
+    "muted":       _psty(fontSize=8,  leading=12, textColor=GREY_C),
+    "check":       _psty(fontSize=8,  leading=13, spaceAfter=4, leftIndent=6),
+    "note":        _psty(fontSize=8,  leading=13, textColor=GREY_C),
+    "foot":        _psty(fontSize=7,  leading=10, textColor=GREY_C),
+}
 
-    s_title   = sty("title",   fontSize=22, leading=28, textColor=dark_c, spaceAfter=4, fontName="Helvetica-Bold")
-    s_sub     = sty("sub",     fontSize=11, leading=16, textColor=grey_c,  spaceAfter=12)
-    s_h2      = sty("h2",      fontSize=13, leading=18, textColor=dark_c,  spaceBefore=14, spaceAfter=6, fontName="Helvetica-Bold")
-    s_body    = sty("body",    fontSize=9,  leading=14, textColor=dark_c,  spaceAfter=4)
-    s_small   = sty("small",   fontSize=8,  leading=12, textColor=grey_c,  spaceAfter=2)
-    s_badge   = sty("badge",   fontSize=8,  leading=12, textColor=grey_c)
-    s_ev      = sty("ev",      fontSize=8,  leading=12, textColor=grey_c,  leftIndent=12, spaceAfter=3)
+_SUM_RK = {lvl: _psty(fontSize=13, fontName="Helvetica-Bold", textColor=c, leading=18)
+           for lvl, c in _RISK_C.items()}
+_SUM_RK[None] = _psty(fontSize=13, fontName="Helvetica-Bold", textColor=GREY_C, leading=18)
 
-    story = []
+# TableStyle parses its command list on construction, so the recurring
+# shapes are parsed once here; exporters pass only the per-result commands
+# (watch-out backgrounds, red-flag separators) as a second setStyle call.
+FLAG_RED_C = _rgb((220, 53, 69))
 
-    # ── Header ──────────────────────────────────────────────────────────────
-    header_data = [[
-        Paragraph("⚖ Terms &amp; Conditions Analysis Report", s_title),
-        Paragraph(f"Generated {_now()}", s_small),
-    ]]
-    header_tbl = Table(header_data, colWidths=[cw*0.75, cw*0.25])
-    header_tbl.setStyle(TableStyle([
+_TBL = {
+    "header": TableStyle([
         ("VALIGN",    (0,0), (-1,-1), "BOTTOM"),
         ("ALIGN",     (1,0), (1,0),   "RIGHT"),
         ("BACKGROUND",(0,0), (-1,-1), colors.white),
         ("BOX",       (0,0), (-1,-1), 0, colors.white),
         ("BOTTOMPADDING", (0,0), (-1,-1), 8),
-    ]))
+    ]),
+    "keypoint": TableStyle([
+        ("VALIGN",      (0,0), (-1,-1), "TOP"),
+        ("LINEBELOW",   (0,0), (-1,-1), 0.75, LGREY_C),
+        ("LEFTPADDING", (0,0), (-1,-1), 8),
+        ("RIGHTPADDING",(0,0), (-1,-1), 8),
+        ("TOPPADDING",  (0,0), (-1,-1), 8),
+        ("BOTTOMPADDING",(0,0), (-1,-1), 8),
+    ]),
+    "checklist": TableStyle([
+        ("VALIGN",       (0,0), (-1,-1), "TOP"),
+        ("LEFTPADDING",  (0,0), (-1,-1), 6),
+        ("RIGHTPADDING", (0,0), (-1,-1), 6),
+        ("TOPPADDING",   (0,0), (-1,-1), 4),
+        ("BOTTOMPADDING",(0,0), (-1,-1), 4),
+        ("LINEBELOW",    (0,0), (-1,-1), 0.3, LGREY_C),
+    ]),
+    "redflag": TableStyle([
+        ("VALIGN",       (0,0), (-1,-1), "TOP"),
+        ("LEFTPADDING",  (0,0), (-1,-1), 6),
+        ("TOPPADDING",   (0,0), (-1,-1), 3),
+        ("BOTTOMPADDING",(0,0), (-1,-1), 3),
+    ]),
+    "metrics": TableStyle([
+        ("BACKGROUND",  (0,0), (-1,0),  DARK_C),
+        ("TEXTCOLOR",   (0,0), (-1,0),  colors.white),
+        ("FONTNAME",    (0,0), (-1,0),  "Helvetica-Bold"),
+        ("FONTSIZE",    (0,0), (-1,-1), 8),
+        ("ROWBACKGROUNDS", (0,1), (-1,-1), [colors.white, LGREY_C]),
+        ("GRID",        (0,0), (-1,-1), 0.3, LGREY_C),
+        ("LEFTPADDING", (0,0), (-1,-1), 6),
+        ("RIGHTPADDING",(0,0), (-1,-1), 6),
+        ("TOPPADDING",  (0,0), (-1,-1), 5),
+        ("BOTTOMPADDING",(0,0), (-1,-1), 5),
+    ]),
+    "sum_kp": TableStyle([
+        ("BACKGROUND",   (0,0), (-1,0),  DARK_C),
+        ("TEXTCOLOR",    (0,0), (-1,0),  colors.white),
+        ("FONTNAME",     (0,0), (-1,0),  "Helvetica-Bold"),
+        ("FONTSIZE",     (0,0), (-1,-1), 8),
+        ("ROWBACKGROUNDS",(0,1), (-1,-1), [colors.white, LGREY_C]),
+        ("GRID",         (0,0), (-1,-1), 0.3, LGREY_C),
+        ("VALIGN",       (0,0), (-1,-1), "MIDDLE"),
+        ("LEFTPADDING",  (0,0), (-1,-1), 6),
+        ("TOPPADDING",   (0,0), (-1,-1), 4),
+        ("BOTTOMPADDING",(0,0), (-1,-1), 4),
+    ]),
+}
+
+def _banner_style(bg, box):
+    return TableStyle([
+        ("BACKGROUND", (0,0), (-1,-1), bg),
+        ("BOX",        (0,0), (-1,-1), 1.5, box),
+        ("VALIGN",     (0,0), (-1,-1), "MIDDLE"),
+        ("LEFTPADDING",(0,0), (-1,-1), 10),
+        ("RIGHTPADDING",(0,0), (-1,-1), 10),
+        ("TOPPADDING", (0,0), (-1,-1), 10),
+        ("BOTTOMPADDING",(0,0), (-1,-1), 10),
+        ("ROUNDEDCORNERS", [6]),
+    ])
+
+_TBL_RISK = {lvl: _banner_style(_RISK_BG[lvl], _RISK_C[lvl]) for lvl in RISK_COLOR}
+_TBL_RISK[None] = _banner_style(_RISK_BG_DEFAULT, GREY_C)
+
+def _pill_style(box):
+    return TableStyle([
+        ("VALIGN",      (0,0), (-1,-1), "MIDDLE"),
+        ("BACKGROUND",  (0,0), (-1,-1), _rgb((240,240,240))),
+        ("BOX",         (0,0), (-1,-1), 1.5, box),
+        ("LEFTPADDING", (0,0), (-1,-1), 10),
+        ("TOPPADDING",  (0,0), (-1,-1), 8),
+        ("BOTTOMPADDING",(0,0), (-1,-1), 8),
+    ])
+
+_TBL_SUM_RISK = {lvl: _pill_style(c) for lvl, c in _RISK_C.items()}
+_TBL_SUM_RISK[None] = _pill_style(GREY_C)
+
+# Page geometry — A4 with fixed margins, so every column width is a constant
+_A4_W, _A4_H = A4
+_CW  = _A4_W - 40*mm             # full-report content width (20 mm margins)
+_SCW = _A4_W - 44*mm             # summary-page content width (22 mm margins)
+
+_HEADER_COLS   = (_CW*0.75, _CW*0.25)
+_RISK_COLS     = (_CW*0.2,  _CW*0.6, _CW*0.2)
+_KEYPOINT_COLS = (14*mm, _CW - 14*mm)
+_NARROW_COLS   = (10*mm, _CW - 10*mm)    # checklist and red-flag tables
+_METRICS_COLS  = (_CW*0.3, _CW*0.2, _CW*0.5)
+_SUM_RISK_COLS = (_SCW*0.32, _SCW*0.68)
+_SUM_KP_COLS   = (8*mm, _SCW*0.25, _SCW*0.65)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Full PDF report  (ReportLab)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def export_pdf_into(result: AnalysisResult, out: BinaryIO) -> None:
+    """Build the full report directly into any writable (file, socket, buffer)."""
+    doc = SimpleDocTemplate(
+        out, pagesize=A4,
+        leftMargin=20*mm, rightMargin=20*mm,
+        topMargin=18*mm, bottomMargin=18*mm,
+        title="T&C Analysis Report"
+    )
+
+    story = []
+
+    # ── Header ──────────────────────────────────────────────────────────────
+    header_data = [[
+        Paragraph("⚖ Terms &amp; Conditions Analysis Report", _S["title"]),
+        Paragraph(f"Generated {_now()}", _S["small"]),
+    ]]
+    header_tbl = Table(header_data, colWidths=_HEADER_COLS)
+    header_tbl.setStyle(_TBL["header"])
     story.append(header_tbl)
-    story.append(HRFlowable(width="100%", thickness=2, color=gold_c, spaceAfter=12))
+    story.append(HRFlowable(width="100%", thickness=2, color=GOLD_C, spaceAfter=12))
 
     # ── Doc type & summary ──────────────────────────────────────────────────
-    story.append(Paragraph(result.document_type.upper(), s_badge))
-    story.append(Paragraph(result.document_summary, s_body))
+    story.append(Paragraph(_esc(result.document_type.upper()), _S["badge"]))
+    story.append(Paragraph(_esc(result.document_summary), _S["body"]))
     story.append(Spacer(1, 6))
 
     # ── Risk banner ─────────────────────────────────────────────────────────
     risk_data = [[
-        Paragraph(f"<b>{_risk_icon(result.risk_level)}  {result.risk_level} Risk</b>", sty("rk", fontSize=14, textColor=rc, fontName="Helvetica-Bold")),
-        Paragraph(result.risk_reason, sty("rr", fontSize=9, leading=13, textColor=dark_c)),
-        Paragraph(f"<b>{result.risk_score}/100</b>", sty("rs", fontSize=14, textColor=rc, fontName="Helvetica-Bold", alignment=2)),
+        Paragraph(f"<b>{_risk_icon(result.risk_level)}  {result.risk_level} Risk</b>", _S_RK.get(result.risk_level, _S_RK[None])),
+        Paragraph(_esc(result.risk_reason), _S["rr"]),
+        Paragraph(f"<b>{result.risk_score}/100</b>", _S_RS.get(result.risk_level, _S_RS[None])),
     ]]
-    risk_tbl = Table(risk_data, colWidths=[cw*0.2, cw*0.6, cw*0.2])
-    risk_tbl.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,-1), rgb(tuple(int(v*0.15) for v in RISK_COLOR.get(result.risk_level, GREY)))),
-        ("BOX",        (0,0), (-1,-1), 1.5, rc),
-        ("VALIGN",     (0,0), (-1,-1), "MIDDLE"),
-        ("LEFTPADDING",(0,0), (-1,-1), 10),
-        ("RIGHTPADDING",(0,0), (-1,-1), 10),
-        ("TOPPADDING", (0,0), (-1,-1), 10),
-        ("BOTTOMPADDING",(0,0), (-1,-1), 10),
-        ("ROUNDEDCORNERS", [6]),
-    ]))
-    story.append(KeepTogether([risk_tbl]))
+    risk_tbl = Table(risk_data, colWidths=_RISK_COLS)
+    risk_tbl.setStyle(_TBL_RISK.get(result.risk_level, _TBL_RISK[None]))
+    story.append(risk_tbl)
     story.append(Spacer(1, 14))
 
     # ── Key Points ──────────────────────────────────────────────────────────
-    story.append(Paragraph("Key Points to Know", s_h2))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=lgrey_c, spaceAfter=8))
-
-    for kp in result.key_points:
-        bg = rgb((255, 193, 7, 15)) if kp.watch_out else rgb((245, 245, 245))
-        border_c = rgb((255, 193, 7)) if kp.watch_out else lgrey_c
-
-        rows = [[
-            Paragraph(kp.icon, sty("ico", fontSize=16, leading=20)),
-            [
-                Paragraph(f"<font color='#888' size='7'>{kp.category.upper()}</font>", s_small),
-                Paragraph(f"<b>{kp.title}</b>{'  <font color=\"#f4c842\" size=\"7\">⚠ WATCH OUT</font>' if kp.watch_out else ''}", sty("kt", fontSize=9, leading=13, fontName="Helvetica-Bold")),
-                Paragraph(kp.detail, s_body),
-            ] + ([Paragraph(f"<i>&ldquo;{ev}&rdquo;</i>", s_ev) for ev in kp.evidence[:1]] if kp.evidence else []),
-        ]]
-        tbl = Table(rows, colWidths=[14*mm, cw - 14*mm])
-        tbl.setStyle(TableStyle([
-            ("VALIGN",      (0,0), (-1,-1), "TOP"),
-            ("BACKGROUND",  (0,0), (-1,-1), colors.white),
-            ("BOX",         (0,0), (-1,-1), 0.75, lgrey_c),
-            ("LEFTPADDING", (0,0), (-1,-1), 8),
-            ("RIGHTPADDING",(0,0), (-1,-1), 8),
-            ("TOPPADDING",  (0,0), (-1,-1), 8),
-            ("BOTTOMPADDING",(0,0), (-1,-1), 8),
-            ("ROUNDEDCORNERS", [4]),
-        ]))
-        story.append(KeepTogether([tbl, Spacer(1, 5)]))
+    if result.key_points:
+        story.append(Paragraph("Key Points to Know", _S["h2"]))
+        story.append(HRFlowable(width="100%", thickness=0.5, color=LGREY_C, spaceAfter=8))
+
+        rows, row_cmds = [], []
+        for i, kp in enumerate(result.key_points):
+            inner = [
+                Paragraph(CAT_FMT.format(_esc(kp.category.upper())), _S["small"]),
+                Paragraph(f"<b>{_esc(kp.title)}</b>{WATCH_HTML if kp.watch_out else ''}", _S["kt"]),
+                Paragraph(_esc(kp.detail), _S["body"]),
+            ]
+            if kp.evidence:
+                inner.append(Paragraph(f"<i>&ldquo;{_esc(kp.evidence[0])}&rdquo;</i>", _S["ev"]))
+            rows.append([Paragraph(kp.icon, _S["ico"]), inner])
+            if kp.watch_out:
+                row_cmds.append(("BACKGROUND", (0, i), (-1, i), _rgb((255, 248, 225))))
+        tbl = Table(rows, colWidths=_KEYPOINT_COLS)
+        tbl.setStyle(_TBL["keypoint"])
+        if row_cmds:
+            tbl.setStyle(TableStyle(row_cmds))
+        story.append(tbl)
 
     story.append(Spacer(1, 6))
 
     # ── Before Signing ──────────────────────────────────────────────────────
-    story.append(Paragraph("Before You Sign", s_h2))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=lgrey_c, spaceAfter=8))
-
-    for i, item in enumerate(result.before_signing, 1):
-        row = [[
-            Paragraph(f"<b>{i}</b>", sty("cn", fontSize=9, textColor=gold_c, fontName="Helvetica-Bold", alignment=1)),
-            Paragraph(item, s_body),
-        ]]
-        t = Table(row, colWidths=[10*mm, cw - 10*mm])
-        t.setStyle(TableStyle([
-            ("VALIGN",       (0,0), (-1,-1), "TOP"),
-            ("LEFTPADDING",  (0,0), (-1,-1), 6),
-            ("RIGHTPADDING", (0,0), (-1,-1), 6),
-            ("TOPPADDING",   (0,0), (-1,-1), 4),
-            ("BOTTOMPADDING",(0,0), (-1,-1), 4),
-            ("LINEBELOW",    (0,0), (-1,0),  0.3, lgrey_c),
-        ]))
+    if result.before_signing:
+        story.append(Paragraph("Before You Sign", _S["h2"]))
+        story.append(HRFlowable(width="100%", thickness=0.5, color=LGREY_C, spaceAfter=8))
+
+        rows = [[
+            Paragraph(f"<b>{i}</b>", _S["cn"]),
+            Paragraph(_esc(item), _S["body"]),
+        ] for i, item in enumerate(result.before_signing, 1)]
+        t = Table(rows, colWidths=_NARROW_COLS)
+        t.setStyle(_TBL["checklist"])
         story.append(t)
 
     story.append(Spacer(1, 10))
 
     # ── Red Flags ───────────────────────────────────────────────────────────
-    story.append(Paragraph("Red Flags", s_h2))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=lgrey_c, spaceAfter=8))
-
     if result.red_flags:
+        story.append(Paragraph("Red Flags", _S["h2"]))
+        story.append(HRFlowable(width="100%", thickness=0.5, color=LGREY_C, spaceAfter=8))
+
+        rows, row_cmds = [], []
         for rf in result.red_flags:
-            items = [
-                [Paragraph("🚩", sty("fi", fontSize=10, leading=14)),
-                 Paragraph(rf.message, s_body)]
-            ]
+            rows.append([Paragraph("🚩", _S["fi"]),
+                         Paragraph(_esc(rf.message), _S["body"])])
             if rf.evidence:
-                items.append([
-                    Paragraph("", s_small),
-                    Paragraph(f"<i>&ldquo;{rf.evidence[0][:200]}&rdquo;</i>", s_ev),
+                rows.append([
+                    Paragraph("", _S["small"]),
+                    Paragraph(f"<i>&ldquo;{_esc(rf.evidence[0][:200])}&rdquo;</i>", _S["ev"]),
                 ])
-            t = Table(items, colWidths=[10*mm, cw - 10*mm])
-            t.setStyle(TableStyle([
-                ("VALIGN",       (0,0), (-1,-1), "TOP"),
-                ("LEFTPADDING",  (0,0), (-1,-1), 6),
-                ("TOPPADDING",   (0,0), (-1,-1), 3),
-                ("BOTTOMPADDING",(0,0), (-1,-1), 3),
-                ("LINEBELOW",    (0,0), (-1,-1), 0.3, rgb((220, 53, 69))),
-            ]))
-            story.append(t)
-    else:
-        story.append(Paragraph("No major red flags detected.", s_small))
-
-    story.append(Spacer(1, 10))
+            end = len(rows) - 1
+            row_cmds.append(("LINEBELOW", (0, end), (-1, end), 0.3, FLAG_RED_C))
+        t = Table(rows, colWidths=_NARROW_COLS)
+        t.setStyle(_TBL["redflag"])
+        t.setStyle(TableStyle(row_cmds))
+        story.append(t)
+        story.append(Spacer(1, 10))
 
     # ── Readability ──────────────────────────────────────────────────────────
     if result.readability:
         rd = result.readability
-        story.append(Paragraph("Readability Analysis", s_h2))
-        story.append(HRFlowable(width="100%", thickness=0.5, color=lgrey_c, spaceAfter=8))
-        story.append(Paragraph(f"<b>{rd.grade_label}</b> — {rd.ease_label}", s_body))
+        story.append(Paragraph("Readability Analysis", _S["h2"]))
+        story.append(HRFlowable(width="100%", thickness=0.5, color=LGREY_C, spaceAfter=8))
+        story.append(Paragraph(f"<b>{_esc(rd.grade_label)}</b> — {_esc(rd.ease_label)}", _S["body"]))
         story.append(Spacer(1, 4))
 
         metrics = [
@@ -224,176 +403,200 @@ def export_pdf(result: AnalysisResult) -> bytes:
             ["Avg Sentence Length", f"{rd.avg_sentence_len} words", "Legal docs often run 20–40 words/sentence"],
             ["Complex Words",       f"{rd.complex_word_pct}%",     "% of words with 3+ syllables"],
         ]
-        mt = Table(metrics, colWidths=[cw*0.3, cw*0.2, cw*0.5])
-        mt.setStyle(TableStyle([
-            ("BACKGROUND",  (0,0), (-1,0),  rgb(DARK)),
-            ("TEXTCOLOR",   (0,0), (-1,0),  colors.white),
-            ("FONTNAME",    (0,0), (-1,0),  "Helvetica-Bold"),
-            ("FONTSIZE",    (0,0), (-1,-1), 8),
-            ("ROWBACKGROUNDS", (0,1), (-1,-1), [colors.white, rgb(LGREY)]),
-            ("GRID",        (0,0), (-1,-1), 0.3, lgrey_c),
-            ("LEFTPADDING", (0,0), (-1,-1), 6),
-            ("RIGHTPADDING",(0,0), (-1,-1), 6),
-            ("TOPPADDING",  (0,0), (-1,-1), 5),
-            ("BOTTOMPADDING",(0,0), (-1,-1), 5),
-        ]))
+        mt = Table(metrics, colWidths=_METRICS_COLS)
+        mt.setStyle(_TBL["metrics"])
         story.append(mt)
 
     # ── Footer ───────────────────────────────────────────────────────────────
     story.append(Spacer(1, 16))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=lgrey_c))
+    story.append(HRFlowable(width="100%", thickness=0.5, color=LGREY_C))
     story.append(Paragraph(
         "⚠ This report is for informational purposes only and does not constitute legal advice. "
         "For important agreements, consult a qualified legal professional.",
-        sty("foot", fontSize=7, leading=10, textColor=grey_c, spaceAfter=0)
+        _S["foot"]
     ))
 
     doc.build(story)
-    return buf.getvalue()
+
+
+def _build_pdf(result: AnalysisResult) -> bytes:
+    buf = io.BytesIO()
+    export_pdf_into(result, buf)
+    return bytes(buf.getbuffer())
+
+def export_pdf(result: AnalysisResult) -> bytes:
+    return _render_cached("pdf", result, _build_pdf)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Summary PDF  — clean one-pager
 # ─────────────────────────────────────────────────────────────────────────────
 
-def export_summary_pdf(result: AnalysisResult) -> bytes:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import ParagraphStyle
-    from reportlab.lib.units import mm
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
-
-    buf = io.BytesIO()
+def export_summary_pdf_into(result: AnalysisResult, out: BinaryIO) -> None:
     doc = SimpleDocTemplate(
-        buf, pagesize=A4,
+        out, pagesize=A4,
         leftMargin=22*mm, rightMargin=22*mm,
         topMargin=20*mm, bottomMargin=20*mm,
     )
-    W, _ = A4
-    cw = W - 44*mm
-
-    def rgb(t): return colors.Color(*[v/255 for v in t])
-
-    rc   = rgb(RISK_COLOR.get(result.risk_level, GREY))
-    gold_c = rgb(GOLD)
-    lgrey_c = rgb(LGREY)
-    grey_c  = rgb(GREY)
-
-    def sty(**kw): return ParagraphStyle("s", **kw)
+    top_kps   = result.key_points[:5]
+    top_flags = result.red_flags[:4]
+    top_steps = result.before_signing[:3]
 
     story = []
 
     # ── Title ────────────────────────────────────────────────────────────────
     story.append(Paragraph(
-        f"<b>T&amp;C Summary</b> &nbsp;<font color='#888' size='9'>— {result.document_type}</font>",
-        sty(fontSize=18, leading=24, fontName="Helvetica-Bold", spaceAfter=2)))
+        f"<b>T&amp;C Summary</b> &nbsp;<font color='#888' size='9'>— {_esc(result.document_type)}</font>",
+        _SUM["title"]))
     story.append(Paragraph(f"<font size='8' color='#888'>Generated {_now()}</font>",
-        sty(fontSize=8, leading=12, spaceAfter=8)))
-    story.append(HRFlowable(width="100%", thickness=2, color=gold_c, spaceAfter=10))
+        _SUM["meta"]))
+    story.append(HRFlowable(width="100%", thickness=2, color=GOLD_C, spaceAfter=10))
 
     # ── Summary ──────────────────────────────────────────────────────────────
-    story.append(Paragraph(result.document_summary,
-        sty(fontSize=9, leading=14, spaceAfter=10)))
+    story.append(Paragraph(_esc(result.document_summary), _SUM["body"]))
 
     # ── Risk pill ────────────────────────────────────────────────────────────
     risk_row = [[
         Paragraph(f"<b>{result.risk_level} Risk — {result.risk_score}/100</b>",
-            sty(fontSize=13, fontName="Helvetica-Bold", textColor=rc, leading=18)),
-        Paragraph(result.risk_reason,
-            sty(fontSize=8, leading=13, spaceAfter=0)),
+            _SUM_RK.get(result.risk_level, _SUM_RK[None])),
+        Paragraph(_esc(result.risk_reason), _SUM["risk_reason"]),
     ]]
-    rt = Table(risk_row, colWidths=[cw*0.32, cw*0.68])
-    rt.setStyle(TableStyle([
-        ("VALIGN",      (0,0), (-1,-1), "MIDDLE"),
-        ("BACKGROUND",  (0,0), (-1,-1), rgb((240,240,240))),
-        ("BOX",         (0,0), (-1,-1), 1.5, rc),
-        ("LEFTPADDING", (0,0), (-1,-1), 10),
-        ("TOPPADDING",  (0,0), (-1,-1), 8),
-        ("BOTTOMPADDING",(0,0), (-1,-1), 8),
-    ]))
+    rt = Table(risk_row, colWidths=_SUM_RISK_COLS)
+    rt.setStyle(_TBL_SUM_RISK.get(result.risk_level, _TBL_SUM_RISK[None]))
     story.append(rt)
     story.append(Spacer(1, 12))
 
     # ── Top key points (first 5) ─────────────────────────────────────────────
     story.append(Paragraph("<b>Key Points</b>",
-        sty(fontSize=11, fontName="Helvetica-Bold", spaceAfter=6)))
+        _SUM["section"]))
 
     kp_data = [["", "Topic", "Summary"]]
-    for kp in result.key_points[:5]:
+    for kp in top_kps:
         kp_data.append([
-            Paragraph(kp.icon, sty(fontSize=11, leading=14)),
-            Paragraph(f"<b>{kp.title}</b>{'  ⚠' if kp.watch_out else ''}",
-                sty(fontSize=8, leading=12, fontName="Helvetica-Bold")),
-            Paragraph(kp.detail, sty(fontSize=8, leading=12)),
+            Paragraph(kp.icon, _SUM["kp_icon"]),
+            Paragraph(f"<b>{_esc(kp.title)}</b>{'  ⚠' if kp.watch_out else ''}",
+                _SUM["kp_title"]),
+            Paragraph(_esc(kp.detail), _SUM["kp_detail"]),
         ])
 
-    kp_tbl = Table(kp_data, colWidths=[8*mm, cw*0.25, cw*0.65])
-    kp_tbl.setStyle(TableStyle([
-        ("BACKGROUND",   (0,0), (-1,0),  rgb(DARK)),
-        ("TEXTCOLOR",    (0,0), (-1,0),  colors.white),
-        ("FONTNAME",     (0,0), (-1,0),  "Helvetica-Bold"),
-        ("FONTSIZE",     (0,0), (-1,-1), 8),
-        ("ROWBACKGROUNDS",(0,1), (-1,-1), [colors.white, rgb(LGREY)]),
-        ("GRID",         (0,0), (-1,-1), 0.3, lgrey_c),
-        ("VALIGN",       (0,0), (-1,-1), "MIDDLE"),
-        ("LEFTPADDING",  (0,0), (-1,-1), 6),
-        ("TOPPADDING",   (0,0), (-1,-1), 4),
-        ("BOTTOMPADDING",(0,0), (-1,-1), 4),
-    ]))
+    kp_tbl = Table(kp_data, colWidths=_SUM_KP_COLS)
+    kp_tbl.setStyle(_TBL["sum_kp"])
     story.append(kp_tbl)
     story.append(Spacer(1, 12))
 
     # ── Top red flags ─────────────────────────────────────────────────────────
     story.append(Paragraph("<b>Red Flags</b>",
-        sty(fontSize=11, fontName="Helvetica-Bold", spaceAfter=6)))
+        _SUM["section"]))
 
     if result.red_flags:
-        for rf in result.red_flags[:4]:
-            story.append(Paragraph(f"🚩  {rf.message}",
-                sty(fontSize=8, leading=13, spaceAfter=3)))
+        for rf in top_flags:
+            story.append(Paragraph(f"🚩  {_esc(rf.message)}",
+                _SUM["flag"]))
     else:
-        story.append(Paragraph("No major red flags detected.",
-            sty(fontSize=8, leading=12, textColor=grey_c)))
+        story.append(Paragraph("No major red flags detected.", _SUM["muted"]))
 
     story.append(Spacer(1, 12))
 
     # ── Checklist (top 3) ────────────────────────────────────────────────────
     story.append(Paragraph("<b>Before You Sign</b>",
-        sty(fontSize=11, fontName="Helvetica-Bold", spaceAfter=6)))
+        _SUM["section"]))
 
-    for i, item in enumerate(result.before_signing[:3], 1):
-        story.append(Paragraph(f"<b>{i}.</b>  {item}",
-            sty(fontSize=8, leading=13, spaceAfter=4, leftIndent=6)))
+    for i, item in enumerate(top_steps, 1):
+        story.append(Paragraph(f"<b>{i}.</b>  {_esc(item)}",
+            _SUM["check"]))
 
     # ── Readability badge ────────────────────────────────────────────────────
     if result.readability:
         story.append(Spacer(1, 8))
         rd = result.readability
         story.append(Paragraph(
-            f"<b>Readability:</b> {rd.grade_label} &nbsp;·&nbsp; "
+            f"<b>Readability:</b> {_esc(rd.grade_label)} &nbsp;·&nbsp; "
             f"Flesch Ease {rd.flesch_ease}/100 &nbsp;·&nbsp; "
             f"Grade Level {rd.flesch_grade} &nbsp;·&nbsp; "
             f"Avg sentence {rd.avg_sentence_len} words",
-            sty(fontSize=8, leading=13, textColor=grey_c)))
+            _SUM["note"]))
 
     story.append(Spacer(1, 12))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=lgrey_c))
+    story.append(HRFlowable(width="100%", thickness=0.5, color=LGREY_C))
     story.append(Paragraph(
         "This summary is for informational purposes only and does not constitute legal advice.",
-        sty(fontSize=7, leading=10, textColor=grey_c)))
+        _SUM["foot"]))
 
     doc.build(story)
-    return buf.getvalue()
+
+
+def _build_summary_pdf(result: AnalysisResult) -> bytes:
+    buf = io.BytesIO()
+    export_summary_pdf_into(result, buf)
+    return bytes(buf.getbuffer())
+
+def export_summary_pdf(result: AnalysisResult) -> bytes:
+    return _render_cached("summary", result, _build_summary_pdf)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Word (.docx) export
 # ─────────────────────────────────────────────────────────────────────────────
 
-def export_word(result: AnalysisResult) -> bytes:
-    from docx import Document
-    from docx.shared import Pt, RGBColor, Inches, Cm
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
+# python-docx drags in lxml, XML schemas, and the default template .docx
+# on first import — too heavy to pay at startup for PDF-only users, but
+# repeat export_word calls shouldn't re-run the import machinery either.
+_DOCX = None
+
+def _load_docx():
+    global _DOCX
+    if _DOCX is None:
+        from docx import Document
+        from docx.oxml import OxmlElement
+        from docx.oxml.ns import qn
+        from docx.shared import Pt, RGBColor, Inches, Cm
+        _DOCX = SimpleNamespace(Document=Document, Pt=Pt, RGBColor=RGBColor,
+                                Inches=Inches, Cm=Cm,
+                                OxmlElement=OxmlElement, qn=qn)
+    return _DOCX
+
+def _run(text, *, bold=False, italic=False, size_pt=None, color_hex=None):
+    """Build a <w:r> directly — python-docx's add_run wrappers re-validate
+    schema per call, which dominates export time for large results."""
+    E, qn = _DOCX.OxmlElement, _DOCX.qn
+    r = E("w:r")
+    rpr = E("w:rPr")
+    if bold:
+        rpr.append(E("w:b"))
+    if italic:
+        rpr.append(E("w:i"))
+    if size_pt:
+        sz = E("w:sz"); sz.set(qn("w:val"), str(size_pt * 2)); rpr.append(sz)
+    if color_hex:
+        c = E("w:color"); c.set(qn("w:val"), color_hex); rpr.append(c)
+    r.append(rpr)
+    t = E("w:t")
+    t.set(qn("xml:space"), "preserve")
+    t.text = text
+    r.append(t)
+    return r
+
+def _fast_para(sect_pr, runs, *, style=None, indent_twips=None):
+    """Insert a raw <w:p> just before the body's trailing <w:sectPr> — the
+    same insertion point python-docx's add_paragraph/add_heading use. A plain
+    body.append would land after the section properties, which is invalid
+    OOXML and scrambles reading order against the wrapped headings."""
+    E, qn = _DOCX.OxmlElement, _DOCX.qn
+    p = E("w:p")
+    if style or indent_twips:
+        ppr = E("w:pPr")
+        if style:
+            st = E("w:pStyle"); st.set(qn("w:val"), style); ppr.append(st)
+        if indent_twips:
+            ind = E("w:ind"); ind.set(qn("w:left"), str(indent_twips)); ppr.append(ind)
+        p.append(ppr)
+    for r in runs:
+        p.append(r)
+    sect_pr.addprevious(p)
+
+def export_word_into(result: AnalysisResult, out: BinaryIO) -> None:
+    d = _load_docx()
+    Document, Pt, RGBColor, Inches, Cm = d.Document, d.Pt, d.RGBColor, d.Inches, d.Cm
 
     doc = Document()
 
@@ -442,44 +645,39 @@ def export_word(result: AnalysisResult) -> bytes:
     add_para(result.risk_reason, size=9)
 
     # ── Key Points ───────────────────────────────────────────────────────────
+    # The three bulk sections below build raw <w:p> elements (0.25" indent =
+    # 360 twips); headings keep the wrappers. All of them insert before the
+    # body's trailing <w:sectPr>, found once here.
+    sect_pr = doc.element.body.find(d.qn("w:sectPr"))
     add_heading("Key Points to Know", 1)
     for kp in result.key_points:
-        p = doc.add_paragraph(style="List Bullet")
-        run = p.add_run(f"{kp.icon}  {kp.title}")
-        run.bold = True; run.font.size = Pt(10)
+        runs = [_run(f"{kp.icon}  {kp.title}", bold=True, size_pt=10)]
         if kp.watch_out:
-            w = p.add_run("  ⚠ Watch Out")
-            w.font.color.rgb = RGBColor(244, 200, 66); w.font.size = Pt(8)
-        cat_p = doc.add_paragraph()
-        cat_p.paragraph_format.left_indent = Inches(0.25)
-        cat_run = cat_p.add_run(f"{kp.category}  ·  {kp.detail}")
-        cat_run.font.size = Pt(9)
+            runs.append(_run("  ⚠ Watch Out", size_pt=8, color_hex="F4C842"))
+        _fast_para(sect_pr, runs, style="ListBullet")
+        _fast_para(sect_pr, [_run(f"{kp.category}  ·  {kp.detail}", size_pt=9)],
+                   indent_twips=360)
         if kp.evidence:
-            ev_p = doc.add_paragraph()
-            ev_p.paragraph_format.left_indent = Inches(0.25)
-            ev_run = ev_p.add_run(f'"{kp.evidence[0][:200]}"')
-            ev_run.italic = True; ev_run.font.size = Pt(8)
-            ev_run.font.color.rgb = RGBColor(*GREY)
+            _fast_para(sect_pr, [_run(f'"{kp.evidence[0][:200]}"', italic=True,
+                                   size_pt=8, color_hex="646464")],
+                       indent_twips=360)
 
     # ── Before Signing ───────────────────────────────────────────────────────
     add_heading("Before You Sign", 1)
-    for i, item in enumerate(result.before_signing, 1):
-        p = doc.add_paragraph(style="List Number")
-        p.add_run(item).font.size = Pt(9)
+    for item in result.before_signing:
+        _fast_para(sect_pr, [_run(item, size_pt=9)], style="ListNumber")
 
     # ── Red Flags ────────────────────────────────────────────────────────────
     add_heading("Red Flags", 1)
     if result.red_flags:
         for rf in result.red_flags:
-            p = doc.add_paragraph(style="List Bullet")
-            run = p.add_run(f"🚩  {rf.message}")
-            run.font.size = Pt(9); run.font.color.rgb = RGBColor(220, 53, 69)
+            _fast_para(sect_pr, [_run(f"🚩  {rf.message}", size_pt=9,
+                                   color_hex="DC3545")],
+                       style="ListBullet")
             if rf.evidence:
-                ev_p = doc.add_paragraph()
-                ev_p.paragraph_format.left_indent = Inches(0.25)
-                ev_run = ev_p.add_run(f'"{rf.evidence[0][:200]}"')
-                ev_run.italic = True; ev_run.font.size = Pt(8)
-                ev_run.font.color.rgb = RGBColor(*GREY)
+                _fast_para(sect_pr, [_run(f'"{rf.evidence[0][:200]}"', italic=True,
+                                       size_pt=8, color_hex="646464")],
+                           indent_twips=360)
     else:
         add_para("No major red flags detected.", color=GREY, size=9)
 
@@ -508,9 +706,16 @@ def export_word(result: AnalysisResult) -> bytes:
     add_para("⚠ This report is for informational purposes only and does not constitute legal advice.",
              italic=True, color=GREY, size=8)
 
+    doc.save(out)
+
+
+def _build_word(result: AnalysisResult) -> bytes:
     buf = io.BytesIO()
-    doc.save(buf)
-    return buf.getvalue()
+    export_word_into(result, buf)
+    return bytes(buf.getbuffer())
+
+def export_word(result: AnalysisResult) -> bytes:
+    return _render_cached("word", result, _build_word)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -518,52 +723,57 @@ def export_word(result: AnalysisResult) -> bytes:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def export_csv(result: AnalysisResult) -> bytes:
-    buf = io.StringIO()
-    w = csv.writer(buf)
+    return _render_cached("csv", result, _build_csv)
+
+def _build_csv(result: AnalysisResult) -> bytes:
+    buf = io.BytesIO()
+    buf.write(b"\xef\xbb\xbf")  # BOM for Excel compatibility
+    tw = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+    w = csv.writer(tw)
 
     # ── Summary ──────────────────────────────────────────────────────────────
-    w.writerow(["SECTION", "FIELD", "VALUE"])
-    w.writerow(["Summary", "Document Type",   result.document_type])
-    w.writerow(["Summary", "Risk Level",      result.risk_level])
-    w.writerow(["Summary", "Risk Score",      result.risk_score])
-    w.writerow(["Summary", "Risk Reason",     result.risk_reason])
-    w.writerow(["Summary", "Word Count",      result.word_count])
-    w.writerow(["Summary", "Char Count",      result.char_count])
-    w.writerow(["Summary", "Summary",         result.document_summary])
-    w.writerow([])
+    w.writerows([
+        ["SECTION", "FIELD", "VALUE"],
+        ["Summary", "Document Type",   result.document_type],
+        ["Summary", "Risk Level",      result.risk_level],
+        ["Summary", "Risk Score",      result.risk_score],
+        ["Summary", "Risk Reason",     result.risk_reason],
+        ["Summary", "Word Count",      result.word_count],
+        ["Summary", "Char Count",      result.char_count],
+        ["Summary", "Summary",         result.document_summary],
+        [],
+    ])
 
     # ── Readability ──────────────────────────────────────────────────────────
     if result.readability:
         rd = result.readability
-        w.writerow(["Readability", "Grade Label",       rd.grade_label])
-        w.writerow(["Readability", "Flesch Ease",       rd.flesch_ease])
-        w.writerow(["Readability", "Flesch Grade",      rd.flesch_grade])
-        w.writerow(["Readability", "Gunning Fog",       rd.gunning_fog])
-        w.writerow(["Readability", "Avg Sentence Len",  rd.avg_sentence_len])
-        w.writerow(["Readability", "Avg Word Len",      rd.avg_word_len])
-        w.writerow(["Readability", "Complex Word %",    rd.complex_word_pct])
+        w.writerows([
+            ["Readability", "Grade Label",       rd.grade_label],
+            ["Readability", "Flesch Ease",       rd.flesch_ease],
+            ["Readability", "Flesch Grade",      rd.flesch_grade],
+            ["Readability", "Gunning Fog",       rd.gunning_fog],
+            ["Readability", "Avg Sentence Len",  rd.avg_sentence_len],
+            ["Readability", "Avg Word Len",      rd.avg_word_len],
+            ["Readability", "Complex Word %",    rd.complex_word_pct],
+        ])
     w.writerow([])
 
     # ── Key Points ───────────────────────────────────────────────────────────
-    w.writerow(["KEY POINTS"])
-    w.writerow(["Category", "Icon", "Title", "Detail", "Watch Out", "Evidence"])
-    for kp in result.key_points:
-        w.writerow([kp.category, kp.icon, kp.title, kp.detail,
-                    "YES" if kp.watch_out else "NO",
-                    " | ".join(kp.evidence)])
+    w.writerows([["KEY POINTS"],
+                 ["Category", "Icon", "Title", "Detail", "Watch Out", "Evidence"]])
+    w.writerows([kp.category, kp.icon, kp.title, kp.detail,
+                 "YES" if kp.watch_out else "NO",
+                 " | ".join(kp.evidence)] for kp in result.key_points)
     w.writerow([])
 
     # ── Red Flags ─────────────────────────────────────────────────────────────
-    w.writerow(["RED FLAGS"])
-    w.writerow(["Message", "Evidence"])
-    for rf in result.red_flags:
-        w.writerow([rf.message, " | ".join(rf.evidence)])
+    w.writerows([["RED FLAGS"], ["Message", "Evidence"]])
+    w.writerows([rf.message, " | ".join(rf.evidence)] for rf in result.red_flags)
     w.writerow([])
 
     # ── Checklist ─────────────────────────────────────────────────────────────
-    w.writerow(["BEFORE SIGNING CHECKLIST"])
-    w.writerow(["#", "Action"])
-    for i, item in enumerate(result.before_signing, 1):
-        w.writerow([i, item])
+    w.writerows([["BEFORE SIGNING CHECKLIST"], ["#", "Action"]])
+    w.writerows([i, item] for i, item in enumerate(result.before_signing, 1))
 
-    return buf.getvalue().encode("utf-8-sig")  # BOM for Excel compatibility
+    tw.detach()  # keep buf alive; rows were written through already
+    return buf.getvalue()
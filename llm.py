@@ -7,27 +7,72 @@ Gracefully degrades to None if Ollama is unavailable or times out.
 All prompts are designed to be fast on small models (llama3.2, mistral, phi3).
 """
 
+import hashlib
 import json
 import os
 import re
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from typing import Optional
 from dataclasses import dataclass, field
 
 import requests
+from requests.adapters import HTTPAdapter
+
+import _cache
+
+# orjson decodes Ollama's NDJSON chunks several times faster than the
+# stdlib parser, and the streaming loop below runs it once per line.
+# Optional, as in the web layer — stdlib json serves when it isn't
+# installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 logger = logging.getLogger(__name__)
 
+# One session for all Ollama traffic — keep-alive connections skip the
+# TCP handshake on each of the five prompts, and the pool is sized for
+# the generation thread pool below.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 # ── Config (overridable via environment variables) ────────────────────────────
 OLLAMA_BASE_URL  = os.environ.get("OLLAMA_BASE_URL",  "http://ollama:11434")
 OLLAMA_MODEL     = os.environ.get("OLLAMA_MODEL",     "llama3.2")
 OLLAMA_TIMEOUT   = int(os.environ.get("OLLAMA_TIMEOUT", "120"))   # seconds
 OLLAMA_ENABLED   = os.environ.get("OLLAMA_ENABLED", "true").lower() != "false"
+# Force the five-prompt path; useful on small models whose structured
+# output is too unreliable for the combined JSON prompt.
+OLLAMA_MULTI_CALL = os.environ.get("OLLAMA_MULTI_CALL", "false").lower() == "true"
 
 # How many characters of the document to send to the LLM
 # (keeps prompt short enough for smaller models)
 MAX_DOC_CHARS = 6000
 
+# Context window and prefill tuning. Ollama's default num_ctx (2048) is
+# too small for a 6000-char excerpt — the prompt silently truncates —
+# and the default prefill batch dribbles through long prompts on CPU.
+# The combined prompt gets a bigger window since it carries the excerpt
+# and all five tasks at once.
+OLLAMA_NUM_CTX    = int(os.environ.get("OLLAMA_NUM_CTX", "4096"))
+OLLAMA_NUM_BATCH  = int(os.environ.get("OLLAMA_NUM_BATCH", "512"))
+OLLAMA_NUM_THREAD = int(os.environ.get("OLLAMA_NUM_THREAD", "0")) or (os.cpu_count() or 4)
+_COMBINED_NUM_CTX = max(OLLAMA_NUM_CTX, 8192)
+
+# Bump to invalidate every on-disk cached response when prompts change.
+PROMPT_VERSION = "v1"
+
+# The five enhancement prompts are independent I/O waits, so they run
+# concurrently — wall-clock becomes max(latency) instead of the sum.
+_GEN_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="ollama")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Data classes
@@ -45,46 +90,209 @@ class LLMInsight:
     enhanced:           bool = False      # False = fallback / unavailable
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Semantic insight cache (optional)
+# ─────────────────────────────────────────────────────────────────────────────
+# Near-duplicate documents — the same vendor's T&C across minor revisions —
+# miss every exact-hash cache yet would get effectively identical insights.
+# When sentence-transformers is installed, embed the excerpt once and reuse
+# a stored insight whenever cosine similarity clears a high bar, skipping
+# all five Ollama calls. Entirely optional, like orjson and tesserocr in
+# the web layer: without the package every lookup is simply a miss.
+try:
+    import numpy as _np
+    from sentence_transformers import SentenceTransformer as _SentenceTransformer
+except ImportError:
+    _np = None
+
+_SEM_MODEL_NAME = os.environ.get("SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+_SEM_THRESHOLD  = 0.97    # cosine; embeddings are L2-normalized
+_SEM_MAX        = 128     # entries kept; oldest evicted first
+
+_sem_lock = threading.Lock()
+_sem_model = None
+_sem_vecs = None          # (n, dim) float32 matrix, one row per entry
+_sem_insights: list = []  # row-aligned with _sem_vecs
+
+
+def _sem_embed(excerpt: str):
+    """Embed the (pre-truncated) excerpt, normalized so dot product = cosine."""
+    global _sem_model
+    if _sem_model is None:
+        with _sem_lock:
+            if _sem_model is None:   # lost the race?
+                _sem_model = _SentenceTransformer(_SEM_MODEL_NAME)
+    vec = _sem_model.encode(excerpt).astype(_np.float32)
+    norm = _np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+def _sem_lookup(vec) -> Optional[LLMInsight]:
+    """Return the stored insight nearest to vec, or None below threshold."""
+    with _sem_lock:
+        if _sem_vecs is None:
+            return None
+        sims = _sem_vecs @ vec          # one GEMV over every stored doc
+        i = int(sims.argmax())
+        if sims[i] >= _SEM_THRESHOLD:
+            return _sem_insights[i]
+    return None
+
+
+def _sem_store(vec, insight: "LLMInsight") -> None:
+    global _sem_vecs
+    with _sem_lock:
+        if _sem_vecs is None:
+            _sem_vecs = vec[None, :]
+        else:
+            _sem_vecs = _np.vstack((_sem_vecs, vec))
+        _sem_insights.append(insight)
+        if len(_sem_insights) > _SEM_MAX:
+            _sem_vecs = _sem_vecs[1:]
+            del _sem_insights[0]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Ollama client
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Memoized liveness probe: every enhancement used to pay a /api/tags
+# round-trip before any real work, even when Ollama answered 100 ms ago.
+# 30 s is fresh enough for a health gate — a daemon that dies mid-window
+# still fails fast on the generate call itself.
+_AVAIL_TTL = 30.0
+_avail_cache = {"ok": False, "at": 0.0}
+_avail_lock = threading.Lock()
+
+
 def _ollama_available() -> bool:
-    """Quick ping to see if Ollama is reachable."""
+    """Quick ping to see if Ollama is reachable (cached for a short TTL)."""
+    now = time.monotonic()
+    if now - _avail_cache["at"] < _AVAIL_TTL:
+        return _avail_cache["ok"]
+    with _avail_lock:
+        if now - _avail_cache["at"] < _AVAIL_TTL:   # lost the race?
+            return _avail_cache["ok"]
+        try:
+            r = _SESSION.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=4)
+            _avail_cache["ok"] = r.status_code == 200
+        except Exception:
+            _avail_cache["ok"] = False
+        _avail_cache["at"] = time.monotonic()
+    return _avail_cache["ok"]
+
+
+def _ollama_prime(doc_type: str, excerpt: str) -> Optional[list]:
+    """
+    Run prefill over the document once and return Ollama's context token
+    array. Each task prompt then passes that array back instead of
+    re-sending (and re-prefilling) the same ~6000-char excerpt five times.
+    """
+    payload = {
+        "model":  OLLAMA_MODEL,
+        "system": SYSTEM_PROMPT,
+        "prompt": f"""Read this {doc_type} document carefully. \
+You will be asked several questions about it. Reply with just OK.
+
+Document (excerpt):
+{excerpt}
+""",
+        "stream": False,
+        "keep_alive": "10m",
+        "options": {
+            "temperature": 0.2, "num_predict": 1, "top_p": 0.9,
+            "num_ctx":    OLLAMA_NUM_CTX,
+            "num_batch":  OLLAMA_NUM_BATCH,
+            "num_thread": OLLAMA_NUM_THREAD,
+        },
+    }
     try:
-        r = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=4)
-        return r.status_code == 200
-    except Exception:
-        return False
+        resp = _SESSION.post(
+            f"{OLLAMA_BASE_URL}/api/generate",
+            json=payload,
+            timeout=OLLAMA_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return _loads(resp.content).get("context")
+    except requests.exceptions.Timeout:
+        logger.warning("Ollama prime timed out after %ds", OLLAMA_TIMEOUT)
+        return None
+    except Exception as e:
+        logger.warning("Ollama prime error: %s", e)
+        return None
 
 
-def _ollama_generate(prompt: str, system: str = "") -> Optional[str]:
+def _ollama_generate(prompt: str, system: str = "", context: Optional[list] = None,
+                     stop_after_items: Optional[int] = None,
+                     num_ctx: int = 0) -> Optional[str]:
     """
     Call /api/generate and return the full response text, or None on failure.
-    Uses stream=False for simplicity.
+
+    Streams the NDJSON response so list-style prompts can close the
+    connection as soon as stop_after_items complete lines have arrived —
+    Ollama stops decoding the moment the socket drops, cutting tail
+    latency instead of always waiting out the full 800-token budget.
     """
     payload = {
         "model":  OLLAMA_MODEL,
         "prompt": prompt,
-        "stream": False,
+        "stream": True,
+        "keep_alive": "10m",   # keep weights resident across the prompt burst
         "options": {
             "temperature":  0.2,    # Low temp = more consistent / factual
             "num_predict":  800,    # Token limit per response
             "top_p":        0.9,
+            "num_ctx":      num_ctx or OLLAMA_NUM_CTX,
+            "num_batch":    OLLAMA_NUM_BATCH,
+            "num_thread":   OLLAMA_NUM_THREAD,
         },
     }
     if system:
         payload["system"] = system
+    if context:
+        payload["context"] = context
+
+    # Outputs are deterministic-ish at temperature 0.2, so identical calls
+    # (same model, prompt wording, and primed document) hit the disk cache
+    # instead of re-running inference. The context array stands in for the
+    # document since the task prompts no longer embed the excerpt.
+    h = hashlib.sha256(f"{OLLAMA_MODEL}|{PROMPT_VERSION}|{system}|{prompt}".encode())
+    if context:
+        h.update(repr(context).encode())
+    key = h.hexdigest()
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
 
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{OLLAMA_BASE_URL}/api/generate",
             json=payload,
             timeout=OLLAMA_TIMEOUT,
+            stream=True,
         )
         resp.raise_for_status()
-        data = resp.json()
-        return data.get("response", "").strip()
+        parts = []
+        try:
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = _loads(line)
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+                # Only re-parse when a line just completed — parsing the
+                # growing buffer per token would be quadratic.
+                if stop_after_items and "\n" in chunk.get("response", ""):
+                    buf = "".join(parts)
+                    done_lines = buf[:buf.rfind("\n")]
+                    if len(_parse_list_response(done_lines, stop_after_items)) >= stop_after_items:
+                        break
+        finally:
+            resp.close()
+        text = "".join(parts).strip()
+        _cache.put(key, text)
+        return text
     except requests.exceptions.Timeout:
         logger.warning("Ollama timed out after %ds", OLLAMA_TIMEOUT)
         return None
@@ -93,19 +301,30 @@ def _ollama_generate(prompt: str, system: str = "") -> Optional[str]:
         return None
 
 
+# Compiled once — these run on every LLM response, sometimes per chunk.
+_FENCE_RE       = re.compile(r"```(?:json)?")
+_JSON_RE        = re.compile(r"\{.*\}", re.DOTALL)
+# One pass over the whole response: optional bullet/number prefix, then a
+# trimmed item of 11+ characters. Lines without a prefix still count, as
+# the old per-line loop allowed. The prefix group is possessive so a
+# too-short item can't backtrack into treating its bullet as content.
+_LIST_ITEM_RE   = re.compile(
+    r"^[ \t]*(?:[\d\-\*\•\·\#]+[\.\): \t]+)?+(\S.{9,}\S)[ \t]*$", re.MULTILINE)
+
+
 def _parse_json_response(text: str) -> Optional[dict]:
     """Extract JSON from model output — handles markdown fences and stray text."""
     if not text:
         return None
     # Strip markdown code fences
-    text = re.sub(r"```(?:json)?", "", text).strip()
+    text = _FENCE_RE.sub("", text).strip()
     # Find the first { ... } block
-    match = re.search(r"\{.*\}", text, re.DOTALL)
+    match = _JSON_RE.search(text)
     if not match:
         return None
     try:
-        return json.loads(match.group())
-    except json.JSONDecodeError:
+        return _loads(match.group())
+    except ValueError:   # covers both json and orjson decode errors
         return None
 
 
@@ -116,15 +335,8 @@ def _parse_list_response(text: str, max_items: int = 5) -> list:
     """
     if not text:
         return []
-    lines = text.strip().splitlines()
-    items = []
-    for line in lines:
-        line = re.sub(r"^[\d\-\*\•\·\#]+[\.\):\s]+", "", line).strip()
-        if line and len(line) > 10:
-            items.append(line)
-        if len(items) >= max_items:
-            break
-    return items
+    return list(islice(
+        (m.group(1) for m in _LIST_ITEM_RE.finditer(text)), max_items))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -137,64 +349,66 @@ Never use legal jargon without immediately explaining it. \
 Respond ONLY with what is asked — no preamble, no sign-off."""
 
 
-def _prompt_summary(doc_type: str, text: str) -> str:
-    return f"""This is a {doc_type} document. In 3–4 sentences, explain in plain English \
-what a person is agreeing to if they sign this. Write as if explaining to a friend.
+def _prompt_combined(doc_type: str, risk_level: str, risk_score: int,
+                     excerpt: str, include_lists: bool = True) -> str:
+    list_keys = """
+ "tips": ["3 to 5 specific things to ask to change or negotiate before signing"],
+ "concerns": ["up to 4 unusual or one-sided clauses that actually appear in the text"],""" \
+        if include_lists else ""
+    return f"""The following {doc_type} has a {risk_level} risk score of {risk_score}/100.
 
 Document (excerpt):
-{text[:MAX_DOC_CHARS]}
+{excerpt}
+
+Respond with ONLY a JSON object, no other text, in exactly this shape:
+{{"summary": "3-4 plain-English sentences on what a person agrees to by signing",
+ "verdict": "one direct sentence: should a typical person sign this, and why",{list_keys}
+ "questions": ["3 to 4 questions to ask the other party before signing"]}}
+
+JSON:"""
+
+
+def _prompt_summary(doc_type: str) -> str:
+    return f"""In 3–4 sentences, explain in plain English what a person is agreeing to \
+if they sign the {doc_type} document above. Write as if explaining to a friend.
 
 Plain English summary:"""
 
 
-def _prompt_verdict(doc_type: str, risk_level: str, risk_score: int, text: str) -> str:
-    return f"""This is a {doc_type} with a {risk_level} risk score of {risk_score}/100.
+def _prompt_verdict(doc_type: str, risk_level: str, risk_score: int) -> str:
+    return f"""The {doc_type} above has a {risk_level} risk score of {risk_score}/100.
 
 Write ONE sentence that gives an honest bottom-line verdict on whether a typical person \
 should sign this, and why. Be direct. No hedging.
 
-Document (excerpt):
-{text[:2000]}
-
 Verdict:"""
 
 
-def _prompt_negotiation(doc_type: str, text: str) -> str:
-    return f"""This is a {doc_type} document.
-
-List 3 to 5 specific, practical things a person could ask to change or negotiate \
-before signing. Be concrete — name the actual clause or term. \
-Format as a numbered list, one tip per line.
-
-Document (excerpt):
-{text[:MAX_DOC_CHARS]}
+def _prompt_negotiation(doc_type: str) -> str:
+    return f"""For the {doc_type} document above, list 3 to 5 specific, practical things \
+a person could ask to change or negotiate before signing. Be concrete — name the \
+actual clause or term. Format as a numbered list, one tip per line.
 
 Negotiation tips:"""
 
 
-def _prompt_concerns(doc_type: str, text: str) -> str:
-    return f"""Read this {doc_type} carefully and identify up to 4 things that are \
-unusual, one-sided, or potentially harmful to the person signing.
+def _prompt_concerns(doc_type: str) -> str:
+    return f"""Identify up to 4 things in the {doc_type} above that are unusual, \
+one-sided, or potentially harmful to the person signing.
 
 Only flag things that actually appear in the text. If it is a fair document, say so.
 Format as a numbered list, one concern per line.
 
-Document (excerpt):
-{text[:MAX_DOC_CHARS]}
-
 Concerns:"""
 
 
-def _prompt_questions(doc_type: str, text: str) -> str:
-    return f"""This is a {doc_type}. What are 3 to 4 specific questions a person \
-should ask the other party before signing?
+def _prompt_questions(doc_type: str) -> str:
+    return f"""What are 3 to 4 specific questions a person should ask the other party \
+before signing the {doc_type} above?
 
 These should be questions whose answers would genuinely change whether they sign.
 Format as a numbered list, one question per line.
 
-Document (excerpt):
-{text[:MAX_DOC_CHARS]}
-
 Questions to ask:"""
 
 
@@ -202,52 +416,165 @@ Questions to ask:"""
 # Main public function
 # ─────────────────────────────────────────────────────────────────────────────
 
+# List-valued insight fields and their item caps; the other two sections
+# (plain_summary, overall_verdict) are plain stripped text.
+_LIST_SECTIONS = {
+    "negotiation_tips": 5,
+    "plain_red_flags":  4,
+    "user_questions":   4,
+}
+
+# Combined-prompt JSON keys → LLMInsight fields.
+_COMBINED_FIELDS = {
+    "summary":   "plain_summary",
+    "verdict":   "overall_verdict",
+    "tips":      "negotiation_tips",
+    "concerns":  "plain_red_flags",
+    "questions": "user_questions",
+}
+
+
+def _enhance_combined(excerpt: str, doc_type: str, risk_level: str,
+                      risk_score: int, on_section=None,
+                      skip_lists: bool = False) -> Optional[LLMInsight]:
+    """
+    One request, all five sections: ask for a strict JSON object and fill
+    the insight from it. Returns None when the model's output doesn't
+    parse into anything usable — the caller falls back to the five-prompt
+    path in that case. skip_lists drops the tips/concerns keys from the
+    requested shape (benign documents have nothing to negotiate or flag).
+    """
+    resp = _ollama_generate(
+        _prompt_combined(doc_type, risk_level, risk_score, excerpt,
+                         include_lists=not skip_lists),
+        SYSTEM_PROMPT, num_ctx=_COMBINED_NUM_CTX)
+    data = _parse_json_response(resp) if resp else None
+    if not data:
+        return None
+
+    insight = LLMInsight(model_used=OLLAMA_MODEL, enhanced=True)
+    got_any = False
+    for key, section in _COMBINED_FIELDS.items():
+        value = data.get(key)
+        max_items = _LIST_SECTIONS.get(section)
+        if max_items is None:
+            value = str(value).strip() if value else ""
+        elif isinstance(value, list):
+            value = [str(v).strip() for v in value if v][:max_items]
+        else:
+            value = []
+        if not value:
+            continue
+        got_any = True
+        setattr(insight, section, value)
+        if on_section is not None:
+            on_section(section, value)
+    return insight if got_any else None
+
+
 def enhance_with_llm(
     text: str,
     doc_type: str,
     risk_level: str,
     risk_score: int,
+    on_section=None,
 ) -> LLMInsight:
     """
     Run the document through the local Ollama LLM for enhanced insights.
 
     Returns an LLMInsight. If Ollama is unavailable or disabled,
     returns an empty LLMInsight with enhanced=False.
+
+    on_section, when given, is called as (field_name, parsed_value) the
+    moment each of the five prompts completes — the web layer uses it to
+    stream sections to the browser instead of waiting for the whole batch.
     """
     if not OLLAMA_ENABLED:
         logger.info("Ollama disabled via OLLAMA_ENABLED=false")
         return LLMInsight()
 
+    # Not every document benefits from inference: a few hundred characters
+    # carry less than the rule engine already extracted, and a clearly
+    # benign document has nothing to negotiate or flag — skip those calls.
+    if len(text) < 500:
+        return LLMInsight(plain_summary="Document too short for enhanced analysis.")
+    skip_lists = risk_score < 10 and risk_level.lower() == "low"
+
+    # Slice the excerpt once — the embedding, prime and combined-prompt
+    # paths all want the same ~6 KB prefix.
+    excerpt = text[:MAX_DOC_CHARS]
+
     if not _ollama_available():
         logger.info("Ollama not reachable at %s", OLLAMA_BASE_URL)
         return LLMInsight()
 
-    insight = LLMInsight(model_used=OLLAMA_MODEL, enhanced=True)
-
-    # ── Plain summary ───────────────────────────────────────────────────────
-    resp = _ollama_generate(_prompt_summary(doc_type, text), SYSTEM_PROMPT)
-    if resp:
-        insight.plain_summary = resp.strip()
-
-    # ── Bottom-line verdict ─────────────────────────────────────────────────
-    resp = _ollama_generate(_prompt_verdict(doc_type, risk_level, risk_score, text), SYSTEM_PROMPT)
-    if resp:
-        insight.overall_verdict = resp.strip()
-
-    # ── Negotiation tips ────────────────────────────────────────────────────
-    resp = _ollama_generate(_prompt_negotiation(doc_type, text), SYSTEM_PROMPT)
-    if resp:
-        insight.negotiation_tips = _parse_list_response(resp, max_items=5)
+    # Semantic lookup: a near-identical document (cosine ≥ threshold) reuses
+    # the stored insight outright — no priming, no generation.
+    vec = None
+    if _np is not None:
+        try:
+            vec = _sem_embed(excerpt)
+            hit = _sem_lookup(vec)
+            if hit is not None:
+                if on_section is not None:   # replay for streaming clients
+                    for name in ("plain_summary", "overall_verdict",
+                                 *_LIST_SECTIONS):
+                        value = getattr(hit, name)
+                        if value:
+                            on_section(name, value)
+                return hit
+        except Exception as e:
+            logger.warning("Semantic cache error: %s", e)
+            vec = None
+
+    # Default path: one combined request instead of prime + five prompts —
+    # the excerpt is prefilled once and the whole batch is a single HTTP
+    # round-trip. Falls through to the multi-call path when the model
+    # can't produce usable JSON (or OLLAMA_MULTI_CALL=true skips it).
+    if not OLLAMA_MULTI_CALL:
+        insight = _enhance_combined(excerpt, doc_type, risk_level, risk_score,
+                                    on_section, skip_lists=skip_lists)
+        if insight is not None:
+            if vec is not None:
+                _sem_store(vec, insight)
+            return insight
+        logger.info("Combined prompt yielded no usable JSON — "
+                    "falling back to per-section prompts")
+
+    # One prefill pass over the document; the context array it returns is
+    # shared by all five task prompts so the excerpt is never re-sent.
+    ctx = _ollama_prime(doc_type, excerpt)
+    if ctx is None:
+        logger.info("Ollama context priming failed — skipping enhancement")
+        return LLMInsight()
 
-    # ── LLM-spotted concerns ────────────────────────────────────────────────
-    resp = _ollama_generate(_prompt_concerns(doc_type, text), SYSTEM_PROMPT)
-    if resp:
-        insight.plain_red_flags = _parse_list_response(resp, max_items=4)
+    insight = LLMInsight(model_used=OLLAMA_MODEL, enhanced=True)
 
-    # ── Questions to ask ────────────────────────────────────────────────────
-    resp = _ollama_generate(_prompt_questions(doc_type, text), SYSTEM_PROMPT)
-    if resp:
-        insight.user_questions = _parse_list_response(resp, max_items=4)
+    # Fire all five prompts at once and handle them in completion order —
+    # a short answer (the one-sentence verdict) reaches the caller while
+    # the longer lists are still decoding.
+    futures = {
+        _GEN_POOL.submit(_ollama_generate, _prompt_summary(doc_type), "", ctx): "plain_summary",
+        _GEN_POOL.submit(_ollama_generate, _prompt_verdict(doc_type, risk_level, risk_score), "", ctx): "overall_verdict",
+        _GEN_POOL.submit(_ollama_generate, _prompt_questions(doc_type), "", ctx, 4): "user_questions",
+    }
+    if not skip_lists:
+        futures[_GEN_POOL.submit(_ollama_generate, _prompt_negotiation(doc_type), "", ctx, 5)] = "negotiation_tips"
+        futures[_GEN_POOL.submit(_ollama_generate, _prompt_concerns(doc_type), "", ctx, 4)] = "plain_red_flags"
+    for fut in as_completed(futures):
+        section = futures[fut]
+        resp = fut.result()
+        if not resp:
+            continue
+        max_items = _LIST_SECTIONS.get(section)
+        value = resp.strip() if max_items is None else \
+            _parse_list_response(resp, max_items=max_items)
+        setattr(insight, section, value)
+        if on_section is not None:
+            on_section(section, value)
+
+    if vec is not None:
+        _sem_store(vec, insight)
 
     return insight
 
@@ -262,11 +589,11 @@ def ollama_status() -> dict:
         return {"available": False, "reason": "Disabled via OLLAMA_ENABLED=false", "model": OLLAMA_MODEL}
 
     try:
-        r = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=4)
+        r = _SESSION.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=4)
         if r.status_code != 200:
             return {"available": False, "reason": f"HTTP {r.status_code}", "model": OLLAMA_MODEL}
 
-        tags = r.json().get("models", [])
+        tags = _loads(r.content).get("models", [])
         model_names = [m.get("name", "") for m in tags]
         model_loaded = any(OLLAMA_MODEL in n for n in model_names)
 
@@ -9,6 +9,7 @@ Produces:
 """
 
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import List, Optional, Dict
 from analyzer import AnalysisResult, KeyPoint
 
@@ -17,7 +18,7 @@ from analyzer import AnalysisResult, KeyPoint
 # Data classes
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class DocRanking:
     """A single document's position in the ranked leaderboard."""
     rank:        int
@@ -28,7 +29,7 @@ class DocRanking:
     strengths:   List[str] = field(default_factory=list)   # What it does well
     weaknesses:  List[str] = field(default_factory=list)   # Key concerns
 
-@dataclass
+@dataclass(slots=True)
 class MatrixCell:
     """One cell in the category × document matrix."""
     present:   bool
@@ -41,14 +42,14 @@ class MatrixCell:
         if self.watch_out:    return "warn"
         return "good"
 
-@dataclass
+@dataclass(slots=True)
 class CategoryRow:
     """One row in the matrix — one category across all docs."""
     category: str
     icon:     str
     cells:    List[MatrixCell]   # one per doc, in same order as rankings
 
-@dataclass
+@dataclass(slots=True)
 class MultiCompareResult:
     doc_names:      List[str]
     rankings:       List[DocRanking]    # sorted 1 (best) → N (worst)
@@ -130,47 +131,59 @@ class MultiCompareResult:
 # Scoring
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _composite_score(result: AnalysisResult) -> float:
+def _composite_score(result: AnalysisResult, watch_count: int) -> float:
     """
     Lower = safer. Composite of:
       - Risk score (0–100)          weight 0.5
       - Red flag count × 4          weight 0.3
       - Watch-out key point count×3 weight 0.2
     """
-    watch_count = sum(1 for kp in result.key_points if kp.watch_out)
     return (
         result.risk_score * 0.5
         + len(result.red_flags) * 4 * 0.3
         + watch_count * 3 * 0.2
     )
 
-def _strengths(name: str, result: AnalysisResult, all_results: list) -> List[str]:
+class _KeyPointSplit:
+    """One doc's key points, partitioned once for the whole comparison.
+
+    Scoring, strengths/weaknesses and the matrix all want either a
+    watch_out split or a category lookup; a single pass here replaces
+    four re-scans per document.
+    """
+    __slots__ = ("good", "watch", "by_cat")
+
+    def __init__(self, result: AnalysisResult):
+        self.good:   List[KeyPoint] = []
+        self.watch:  List[KeyPoint] = []
+        self.by_cat: Dict[str, KeyPoint] = {}
+        for kp in result.key_points:
+            (self.watch if kp.watch_out else self.good).append(kp)
+            # First occurrence wins, matching the old linear scans.
+            self.by_cat.setdefault(kp.category, kp)
+
+def _strengths(name: str, result: AnalysisResult, good_pts: List[KeyPoint],
+               avg_risk: float, avg_flags: float) -> List[str]:
     """Generate plain-English strengths relative to peers."""
     items = []
-    avg_risk = sum(r.risk_score for _, r in all_results) / len(all_results)
-    avg_flags = sum(len(r.red_flags) for _, r in all_results) / len(all_results)
-
     if result.risk_score < avg_risk - 10:
         items.append(f"Risk score ({result.risk_score}/100) is well below average")
     if len(result.red_flags) < avg_flags:
         items.append("Fewer red flags than most alternatives")
-    good_pts = [kp for kp in result.key_points if not kp.watch_out]
     if good_pts:
         items.append(f"Favourable terms on: {', '.join(kp.category for kp in good_pts[:3])}")
     if result.readability and result.readability.flesch_ease >= 50:
         items.append("Written in relatively plain language")
     return items[:3] if items else ["No particular strengths identified"]
 
-def _weaknesses(name: str, result: AnalysisResult, all_results: list) -> List[str]:
+def _weaknesses(name: str, result: AnalysisResult, watch_pts: List[KeyPoint],
+                avg_risk: float, avg_flags: float) -> List[str]:
     """Generate plain-English weaknesses."""
     items = []
-    avg_risk = sum(r.risk_score for _, r in all_results) / len(all_results)
-
     if result.risk_score > avg_risk + 10:
         items.append(f"Risk score ({result.risk_score}/100) is above average")
     if result.red_flags:
         items.append(f"{len(result.red_flags)} red flag(s) detected")
-    watch_pts = [kp for kp in result.key_points if kp.watch_out]
     if watch_pts:
         items.append(f"Concerning clauses: {', '.join(kp.category for kp in watch_pts[:3])}")
     if result.readability and result.readability.flesch_ease < 35:
@@ -205,22 +218,23 @@ MATRIX_CATEGORY_ORDER = [
     "Governing Law",
 ]
 
-def _build_matrix(doc_pairs: list, ranked_names: List[str]) -> List[CategoryRow]:
+def _build_matrix(ranked_names: List[str],
+                  splits: Dict[str, _KeyPointSplit]) -> List[CategoryRow]:
     """
     Build category × doc matrix.
-    doc_pairs = [(name, AnalysisResult), ...]  in original order
     ranked_names = names in rank order (best first) — used for column order
+    splits       = per-doc key-point partitions, keyed by name
     """
-    # Reorder docs by rank
-    name_to_result = {name: r for name, r in doc_pairs}
-    ordered = [(n, name_to_result[n]) for n in ranked_names]
+    # Column order = rank order; the category index was already built when
+    # the key points were partitioned.
+    indexes = [splits[n].by_cat for n in ranked_names]
 
     # Collect all categories across all docs
     all_cats: Dict[str, str] = {}   # category → icon
-    for _, result in ordered:
-        for kp in result.key_points:
-            if kp.category not in all_cats:
-                all_cats[kp.category] = kp.icon
+    for idx in indexes:
+        for cat, kp in idx.items():
+            if cat not in all_cats:
+                all_cats[cat] = kp.icon
 
     # Sort by canonical order
     def sort_key(c):
@@ -231,8 +245,8 @@ def _build_matrix(doc_pairs: list, ranked_names: List[str]) -> List[CategoryRow]
     for cat in sorted(all_cats.keys(), key=sort_key):
         icon = all_cats[cat]
         cells = []
-        for _, result in ordered:
-            kp = next((k for k in result.key_points if k.category == cat), None)
+        for idx in indexes:
+            kp = idx.get(cat)
             if kp:
                 cells.append(MatrixCell(True, kp.watch_out, kp.detail[:120]))
             else:
@@ -313,28 +327,34 @@ def multi_compare(doc_pairs: list) -> MultiCompareResult:
     if len(doc_pairs) < 2:
         raise ValueError("Need at least 2 documents to compare.")
 
-    # Score and rank
+    # Partition every doc's key points in one pass, then score and rank.
+    splits = {name: _KeyPointSplit(result) for name, result in doc_pairs}
     scored = [
-        (name, result, _composite_score(result))
+        (name, result, _composite_score(result, len(splits[name].watch)))
         for name, result in doc_pairs
     ]
-    scored.sort(key=lambda x: x[2])   # ascending — lower score = safer = better rank
+    scored.sort(key=itemgetter(2))   # ascending — lower score = safer = better rank
+
+    # Peer averages are the same for every doc — compute them once up front.
+    n = len(scored)
+    avg_risk = sum(r.risk_score for _, r, _ in scored) / n
+    avg_flags = sum(len(r.red_flags) for _, r, _ in scored) / n
 
     rankings: List[DocRanking] = []
     for rank, (name, result, score) in enumerate(scored, 1):
-        watch_count = sum(1 for kp in result.key_points if kp.watch_out)
+        split = splits[name]
         rankings.append(DocRanking(
             rank=rank,
             name=name,
             result=result,
             total_score=round(score, 1),
-            watch_count=watch_count,
-            strengths=_strengths(name, result, [(n, r) for n, r, _ in scored]),
-            weaknesses=_weaknesses(name, result, [(n, r) for n, r, _ in scored]),
+            watch_count=len(split.watch),
+            strengths=_strengths(name, result, split.good, avg_risk, avg_flags),
+            weaknesses=_weaknesses(name, result, split.watch, avg_risk, avg_flags),
         ))
 
     ranked_names = [r.name for r in rankings]
-    matrix       = _build_matrix(doc_pairs, ranked_names)
+    matrix       = _build_matrix(ranked_names, splits)
     winner_reason, recommendation = _build_recommendation(rankings)
 
     return MultiCompareResult(
@@ -0,0 +1,10 @@
+"""
+wsgi.py — production entry point.
+
+Gunicorn (see Dockerfile) loads `wsgi:application`; keeping the WSGI
+handle here leaves app.py's `__main__` block purely for local development.
+"""
+
+from app import app
+
+application = app